@@ -62,6 +62,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # DRF
     "rest_framework",
     "rest_framework.authtoken",
@@ -84,6 +85,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "compression.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -133,6 +135,73 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory is fine for a single node; set CACHE_REDIS_URL so every
+# gunicorn worker shares the same entries (and the same version counters).
+
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "article39",
+        }
+    }
+
+# Public web-api/ responses (seconds). Writes bump a per-resource version,
+# so this only bounds how long unused entries stay around.
+WEBSITE_CACHE_TIMEOUT = int(os.getenv("WEBSITE_CACHE_TIMEOUT", 60 * 60))
+
+# Pre-rendered JSON for the default list pages, details and home payload,
+# republished on every admin write (see website/snapshots.py)
+WEBSITE_SNAPSHOTS_ENABLED = os.getenv("WEBSITE_SNAPSHOTS_ENABLED", "true").lower() == "true"
+WEBSITE_SNAPSHOT_LIST_PAGES = int(os.getenv("WEBSITE_SNAPSHOT_LIST_PAGES", 3))
+
+# Responses smaller than this (bytes) are sent uncompressed, see compression.py
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+
+# "batched" group-commits ticket and show bookings with bulk_create (see
+# website/ingestion.py); it needs threaded gunicorn workers to batch anything.
+# A request waits at most BOOKING_INGESTION_MAX_WAIT_MS for its batch, and
+# writes its row itself if the writer hasn't taken it within
+# BOOKING_INGESTION_TIMEOUT_MS.
+BOOKING_INGESTION_MODE = os.getenv("BOOKING_INGESTION_MODE", "direct")
+BOOKING_INGESTION_BATCH_SIZE = int(os.getenv("BOOKING_INGESTION_BATCH_SIZE", 100))
+BOOKING_INGESTION_MAX_WAIT_MS = int(os.getenv("BOOKING_INGESTION_MAX_WAIT_MS", 20))
+BOOKING_INGESTION_MAX_PENDING = int(os.getenv("BOOKING_INGESTION_MAX_PENDING", 1000))
+BOOKING_INGESTION_TIMEOUT_MS = int(os.getenv("BOOKING_INGESTION_TIMEOUT_MS", 1000))
+
+# Upper bound on create + update + delete operations in one request to the
+# web-api/<resource>/batch/ endpoints (see website/batch.py)
+WEBSITE_BATCH_MAX_OPERATIONS = int(os.getenv("WEBSITE_BATCH_MAX_OPERATIONS", 500))
+
+# Tickets in one booking. Also bounds the pages of the ticket PDF mailed
+# to the buyer, bookings are public
+TICKETS_PER_BOOKING_MAX = int(os.getenv("TICKETS_PER_BOOKING_MAX", 10))
+
+# Email attachments are rendered by a pool of warm WeasyPrint processes (see
+# pdf_rendering.py), per gunicorn worker. Renders run at PDF_RENDER_NICENESS
+# so a burst of ticket confirmations doesn't starve request handling.
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", 1))
+PDF_RENDER_NICENESS = int(os.getenv("PDF_RENDER_NICENESS", 10))
+
+# Rows fetched per server-side cursor round trip by the ?format=csv|ndjson
+# exports (see exports.py)
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))
+
+# Postgres text search configuration used for web-api/search/
+WEBSITE_SEARCH_CONFIG = os.getenv("WEBSITE_SEARCH_CONFIG", "english")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -153,14 +222,28 @@ AUTH_PASSWORD_VALIDATORS = [
 
 ########################## JWT Config ##########################
 
+# API_PROFILE=production serves JSON only; the browsable API renderer is
+# slow on large lists and only useful while developing.
+API_PROFILE = os.getenv("API_PROFILE", "development")
+
+if API_PROFILE == "production":
+    API_RENDERER_CLASSES = ("renderers.ORJSONRenderer",)
+else:
+    API_RENDERER_CLASSES = (
+        "renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "utils.custom_exception_handler",
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
-    "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
+    "DEFAULT_RENDERER_CLASSES": API_RENDERER_CLASSES,
+    "DEFAULT_PARSER_CLASSES": (
+        "renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ),
     # "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.coreapi.AutoSchema",
 }
@@ -259,6 +342,29 @@ MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# Resized WebP/JPEG copies of cover and carousel images, rendered by a
+# background process pool when an image URL is saved (see website/images.py).
+# Set IMAGE_VARIANTS_STORAGE to a storage backend that serves its files.
+# The local disk default is only served by the DEBUG media route, so it is
+# for testing: variants stay off with it unless IMAGE_VARIANTS_ENABLED=true.
+IMAGE_VARIANTS_STORAGE = os.getenv("IMAGE_VARIANTS_STORAGE", "website.images.LocalImageStorage")
+IMAGE_VARIANTS_ENABLED = os.getenv(
+    "IMAGE_VARIANTS_ENABLED",
+    str(IMAGE_VARIANTS_STORAGE != "website.images.LocalImageStorage"),
+).lower() == "true"
+IMAGE_VARIANTS_BASE_URL = os.getenv("IMAGE_VARIANTS_BASE_URL", f"{MEDIA_URL}image_variants/")
+IMAGE_VARIANT_WIDTHS = [int(width) for width in os.getenv("IMAGE_VARIANT_WIDTHS", "320,768,1440").split(",")]
+IMAGE_VARIANT_FORMATS = ["webp", "jpeg"]
+IMAGE_VARIANT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", 80))
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", 1))
+IMAGE_VARIANT_NICENESS = int(os.getenv("IMAGE_VARIANT_NICENESS", 10))
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "image_variants": {"BACKEND": IMAGE_VARIANTS_STORAGE},
+}
+
 CLOUDINARY_API_SECRET = os.getenv("CLOUDINARY_API_SECRET")
 CLOUDINARY_API_KEY = os.getenv("CLOUDINARY_API_KEY")
 CLOUDINARY_CLOUD_NAME = os.getenv("CLOUDINARY_CLOUD_NAME")
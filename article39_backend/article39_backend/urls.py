@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenRefreshView
@@ -52,3 +54,6 @@ urlpatterns = [
     path("administrator/", include("administrator.urls")),
     path("web-api/", include("website.urls")),
 ]
+
+# Image variants on the local disk storage (DEBUG only, see website/images.py)
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
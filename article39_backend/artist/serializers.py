@@ -1,8 +1,9 @@
 from artist.models import Song, Artist, GigApplication, Payment, Documents
 from rest_framework import serializers
+from fieldsets import SparseFieldsetMixin
 
 
-class SongSerializer(serializers.ModelSerializer):
+class SongSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Song
         fields = "__all__"
@@ -20,7 +21,7 @@ class SongSerializer(serializers.ModelSerializer):
         ]
 
 
-class GigApplicationSerializer(serializers.ModelSerializer):
+class GigApplicationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     song_music_details = SongSerializer(source="song", read_only=True)
 
     class Meta:
@@ -29,7 +30,7 @@ class GigApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "user", "applied_at"]
 
 
-class PaymentSerializer(serializers.ModelSerializer):
+class PaymentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     gig_info = serializers.SerializerMethodField()
 
     class Meta:
@@ -52,7 +53,7 @@ class PaymentSerializer(serializers.ModelSerializer):
         return None
 
 
-class PaymentToGetSerializer(serializers.ModelSerializer):
+class PaymentToGetSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     gig_name = serializers.CharField(source="gig.title", read_only=True)
     min_payment = serializers.DecimalField(
         source="gig.min_payment", max_digits=10, decimal_places=2, read_only=True
@@ -81,7 +82,7 @@ class PaymentToGetSerializer(serializers.ModelSerializer):
         return payment.status if payment else "NOT_REQUESTED"
 
 
-class DocumentsSerializer(serializers.ModelSerializer):
+class DocumentsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Documents
         fields = "__all__"
@@ -8,6 +8,7 @@ from media_utilities.song_analytics_extractor import YouTubeVideoFetcher
 from media_utilities.duration_extractor import get_audio_duration_from_url_threaded
 from datetime import datetime
 from django.db.models import Q
+from fieldsets import sparse_queryset
 
 
 # serializers
@@ -129,11 +130,11 @@ class EnlistSongAPIView(APIView):
 
         # single song
         if request.GET.get("id"):
-            song = request.user.artist_profile.songs.filter(
-                id=request.GET.get("id")
-            ).first()
+            song = sparse_queryset(
+                request, request.user.artist_profile.songs.all(), SongSerializer
+            ).filter(id=request.GET.get("id")).first()
             if song:
-                serializer = SongSerializer(song)
+                serializer = SongSerializer(song, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             else:
                 return Response(
@@ -154,10 +155,10 @@ class EnlistSongAPIView(APIView):
         else:
             queryset = request.user.artist_profile.songs.all()
 
-        queryset = queryset.order_by("-added_at")
+        queryset = sparse_queryset(request, queryset.order_by("-added_at"), SongSerializer)
         paginator = StandardResultsSetPagination()
         page = paginator.paginate_queryset(queryset, request)
-        serializer = SongSerializer(page, many=True)
+        serializer = SongSerializer(page, many=True, context={"request": request})
         return Response(
             {
                 "success": True,
@@ -453,7 +454,10 @@ class PaymentAPIView(APIView):
                 )
                 .order_by("-applied_at")
             )
-            serializer = PaymentToGetSerializer(gig_application, many=True)
+            gig_application = sparse_queryset(request, gig_application, PaymentToGetSerializer)
+            serializer = PaymentToGetSerializer(
+                gig_application, many=True, context={"request": request}
+            )
             return Response(
                 {
                     "success": True,
@@ -468,9 +472,10 @@ class PaymentAPIView(APIView):
             .order_by("-created_at")
         )
 
+        payment_instances = sparse_queryset(request, payment_instances, self.serializer)
         paginator = StandardResultsSetPagination()
         page = paginator.paginate_queryset(payment_instances, request)
-        serializer = self.serializer(page, many=True)
+        serializer = self.serializer(page, many=True, context={"request": request})
         return Response(
             {"success": True, **paginator.get_paginated_response(serializer.data).data},
             status=status.HTTP_200_OK,
@@ -497,7 +502,7 @@ class DocumentsAPIView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serilizer = self.serializer(documents)
+        serilizer = self.serializer(documents, context={"request": request})
         return Response(
             {"success": True, "documents": serilizer.data}, status=status.HTTP_200_OK
         )
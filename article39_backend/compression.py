@@ -0,0 +1,143 @@
+import gzip
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # optional, gzip only without it
+    brotli = None
+
+
+# Preferred first when the client accepts several
+ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+# Quality used on the fly, and for variants that are stored and served many times
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+BROTLI_STORED_QUALITY = 9
+
+KEY_PREFIX = "compression"
+
+re_accepts_encoding = re.compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*")
+
+
+def _accepted_encoding(request):
+    accepted = {}
+    for part in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        match = re_accepts_encoding.fullmatch(part)
+        if match:
+            try:
+                accepted[match.group(1).lower()] = float(match.group(2) or 1)
+            except ValueError:
+                continue
+    # Highest q-value wins, ties go to the order of ENCODINGS
+    weights = [(accepted.get(encoding, accepted.get("*", 0)), encoding) for encoding in ENCODINGS]
+    weight, encoding = max(weights, key=lambda item: item[0])
+    return encoding if weight > 0 else None
+
+
+def _compressible(response):
+    content_type = response.get("Content-Type", "").split(";")[0].strip()
+    return content_type.startswith("text/") or content_type.endswith(("json", "xml", "javascript"))
+
+
+def compress(content, encoding, stored=False):
+    if encoding == "br":
+        quality = BROTLI_STORED_QUALITY if stored else BROTLI_QUALITY
+        return brotli.compress(content, quality=quality)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _stats_key(encoding, metric):
+    return f"{KEY_PREFIX}:stats:{encoding}:{metric}"
+
+
+def _incr(key, delta=1):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def _record(encoding, bytes_in, bytes_out, precompressed):
+    _incr(_stats_key(encoding, "responses"))
+    _incr(_stats_key(encoding, "bytes_in"), bytes_in)
+    _incr(_stats_key(encoding, "bytes_out"), bytes_out)
+    if precompressed:
+        _incr(_stats_key(encoding, "precompressed"))
+
+
+def get_compression_stats():
+    metrics = ("responses", "bytes_in", "bytes_out", "precompressed")
+    values = cache.get_many([_stats_key(encoding, metric) for encoding in ENCODINGS for metric in metrics])
+    stats = {}
+    for encoding in ENCODINGS:
+        entry = {metric: values.get(_stats_key(encoding, metric), 0) for metric in metrics}
+        entry["bytes_saved"] = entry["bytes_in"] - entry["bytes_out"]
+        entry["ratio"] = round(entry["bytes_out"] / entry["bytes_in"], 3) if entry["bytes_in"] else None
+        stats[encoding] = entry
+    return stats
+
+
+class CompressionMiddleware:
+    """
+    Compress text and JSON responses with brotli or gzip, whichever the client
+    prefers, when the body is at least COMPRESSION_MIN_SIZE bytes.
+
+    Views that serve the same bytes over and over (the website read cache and
+    snapshots) set `response.compression_key` to a key identifying those
+    bytes. The compressed variant is then stored in the cache under that key
+    and reused instead of compressing the body again on every request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header("Content-Encoding")
+            or not _compressible(response)
+            or len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = _accepted_encoding(request)
+        if encoding is None:
+            return response
+
+        content = response.content
+        compression_key = getattr(response, "compression_key", None)
+        compressed, precompressed = None, False
+        if compression_key:
+            variant_key = f"{KEY_PREFIX}:{compression_key}:{encoding}"
+            compressed = cache.get(variant_key)
+            precompressed = compressed is not None
+            if compressed is None:
+                compressed = compress(content, encoding, stored=True)
+                cache.set(variant_key, compressed, settings.WEBSITE_CACHE_TIMEOUT)
+        else:
+            compressed = compress(content, encoding)
+
+        # Not worth it, e.g. already compressed data inside a JSON string
+        if len(compressed) >= len(content):
+            return response
+
+        _record(encoding, len(content), len(compressed), precompressed)
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+
+        # The compressed body is not byte-identical to the original anymore
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
@@ -0,0 +1,123 @@
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import BaseRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from renderers import ORJSONRenderer
+
+
+class _Echo:
+    # csv.writer wants a file, hand each formatted line straight back
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=JSONEncoder, ensure_ascii=False)
+    return value
+
+
+def _csv_lines(header, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_cell(row.get(name)) for name in header])
+
+
+def _ndjson_lines(rows):
+    renderer = ORJSONRenderer()
+    for row in rows:
+        yield renderer.render(row) + b"\n"
+
+
+def _as_rows(data):
+    # Anything else these renderers are handed (error payloads mostly)
+    if isinstance(data, dict):
+        return [data]
+    return list(data or [])
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    `?format=csv`. Exports are streamed by export_response() and never
+    reach render(); it only formats ordinary payloads such as errors.
+    """
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = _as_rows(data)
+        header = list(rows[0]) if rows and isinstance(rows[0], dict) else []
+        return "".join(_csv_lines(header, rows)).encode()
+
+
+class NDJSONRenderer(BaseRenderer):
+    """`?format=ndjson`, one JSON object per line. See CSVRenderer."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b"".join(_ndjson_lines(_as_rows(data)))
+
+
+# renderer_classes of the views with exports
+EXPORT_RENDERER_CLASSES = [*api_settings.DEFAULT_RENDERER_CLASSES, CSVRenderer, NDJSONRenderer]
+
+
+def wants_export(request):
+    return request.accepted_renderer.format in (CSVRenderer.format, NDJSONRenderer.format)
+
+
+def _serialized(queryset, serializer):
+    # Server-side cursor: rows arrive chunk by chunk and each one is
+    # dropped once it is written, whatever the size of the table
+    for row in queryset.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE):
+        yield serializer.to_representation(row)
+
+
+def _chunked(lines):
+    # Send a few hundred lines per write rather than one per row
+    lines = iter(lines)
+    while chunk := list(islice(lines, 500)):
+        yield "".join(chunk).encode() if isinstance(chunk[0], str) else b"".join(chunk)
+
+
+def export_response(request, queryset, serializer_class, filename):
+    """
+    Stream `queryset` as CSV or NDJSON (whichever `?format=` asked for),
+    serialized with `serializer_class` so `?fields=`/`?exclude=` apply.
+    Admins only: exports carry every applicant's or buyer's contact details.
+    """
+    if not (request.user and request.user.is_authenticated and request.user.is_admin):
+        return Response(
+            {"success": False, "message": "You are not authorized to perform this action"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    serializer = serializer_class(context={"request": request})
+    rows = _serialized(queryset, serializer)
+    renderer = request.accepted_renderer
+    if renderer.format == CSVRenderer.format:
+        lines = _csv_lines(list(serializer.fields), rows)
+        content_type = f"{renderer.media_type}; charset={renderer.charset}"
+    else:
+        lines = _ndjson_lines(rows)
+        content_type = renderer.media_type
+
+    response = StreamingHttpResponse(_chunked(lines), content_type=content_type)
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{renderer.format}"'
+    return response
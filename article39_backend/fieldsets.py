@@ -0,0 +1,99 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+
+
+# Always loaded, whatever the selection: the primary key, and created_at
+# because the cursor paginator reads it off the last row of every page.
+ALWAYS_LOADED = ("created_at",)
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def requested_fields(request):
+    """Return the (`?fields=`, `?exclude=`) selections of a GET request, or (None, None)."""
+    if request is None or request.method != "GET":
+        return None, None
+    fields = _split(request.GET.get("fields", "")) or None
+    exclude = _split(request.GET.get("exclude", "")) or None
+    return fields, exclude
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for `?fields=a,b` and `?exclude=c`. The request is read
+    from the serializer context, so only serializers built with
+    `context={"request": request}` on a GET are trimmed; writes and nested
+    serializers always get every field.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields, exclude = requested_fields(self.context.get("request"))
+        if fields is None and exclude is None:
+            return
+
+        unknown = set(fields or []) - set(self.fields)
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+        unknown = set(exclude or []) - set(self.fields)
+        if unknown:
+            raise ValidationError({"exclude": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or (exclude and name in exclude):
+                self.fields.pop(name)
+
+
+def _columns(serializer_fields, model):
+    """
+    Model fields backing the given serializer fields, or None when one of
+    them can't be traced to a column (method fields, `source="*"`, reverse
+    relations); the queryset is then left alone.
+    """
+    columns = set()
+    for field in serializer_fields:
+        if field.source == "*":
+            return None
+        try:
+            model_field = model._meta.get_field(field.source.split(".")[0])
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete or model_field.many_to_many:
+            return None
+        columns.add(model_field.name)
+    return columns
+
+
+def sparse_queryset(request, queryset, serializer_class):
+    """
+    Push the `?fields=`/`?exclude=` selection down into `.only()`/`.defer()`,
+    so large text and JSON columns nobody asked for are never read.
+    """
+    fields, exclude = requested_fields(request)
+    if fields is None and exclude is None:
+        return queryset
+    if queryset.query.values_select:
+        # .values() querysets already select their own columns
+        return queryset
+
+    model = queryset.model
+    all_fields = serializer_class().fields
+    selected = serializer_class(context={"request": request}).fields
+    always = {model._meta.pk.name} | {
+        name for name in ALWAYS_LOADED if any(f.name == name for f in model._meta.concrete_fields)
+    }
+
+    # Method fields may read any column, leave the queryset alone then
+    kept = _columns(selected.values(), model)
+    if kept is None:
+        return queryset
+    if fields is not None:
+        return queryset.only(*(kept | always))
+
+    dropped = set()
+    for name, field in all_fields.items():
+        if name not in selected:
+            dropped |= _columns([field], model) or set()
+    return queryset.defer(*(dropped - kept - always))
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db import connections
+from django.db.models.signals import pre_migrate
+
+
+def create_extensions(sender, using, **kwargs):
+    # The name_search indexes use pg_trgm's operator class. Migrations
+    # aren't kept in the repo, so the extension can't come from a
+    # TrigramExtension operation; create it before the tables are
+    with connections[using].cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
 
 
 class FormConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'form'
+
+    def ready(self):
+        pre_migrate.connect(create_extensions, sender=self)
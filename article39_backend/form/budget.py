@@ -0,0 +1,115 @@
+import math
+
+from rest_framework.exceptions import ValidationError
+
+
+# Cost lines summed into each FilmMaker.<section>_subtotal column. Lists of
+# people and cameras are counted through the subtotals the form fills in.
+SECTION_COSTS = {
+    "pre_production": ("script_writing", "storyboarding_concept_art", "location_scouting", "administrative"),
+    "talent_and_crews": ("artist_subtotal_cost", "crew_subtotal"),
+    "equipment_and_technical": ("camera_subtotal", "lighting_equipment", "sound_recording_equipment", "others"),
+    "location_and_sets": ("location_rent", "set_construct", "production_design"),
+    "transportation_and_logistics": ("vehicle_rent", "fuel", "driver_fee"),
+    "wardrobe_and_costumes": ("costume_purchase", "styling"),
+    "catering": ("subtotal",),
+    "snacks_craft_services": ("fee",),
+    "post_production": ("editing", "color_grading", "sound_design", "music", "additional"),
+    "contingency_misc": ("contingency_fund", "insurance"),
+}
+
+SUBTOTAL_FIELDS = [f"{section}_subtotal" for section in SECTION_COSTS]
+
+# Columns filled by apply_budget_summary(), bulk writers have to save them too
+BUDGET_FIELDS = ["budget_total", *SUBTOTAL_FIELDS, "expected_shoot_days", "genre"]
+
+# `?ordering=` values for the film maker list, each backed by an index
+ORDERING_FIELDS = ("created_at", "budget_total", "expected_shoot_days", "genre")
+
+
+def _number(value):
+    # Form fields sometimes arrive as "12" or "1,50,000"
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.replace(",", "").strip())
+        except ValueError:
+            return None
+    return None
+
+
+def summarize_budget(budget_breakdown, payment_terms, production_overview):
+    """{column: value} for BUDGET_FIELDS, from the FilmMaker JSON sections."""
+    budget_breakdown = budget_breakdown if isinstance(budget_breakdown, dict) else {}
+    summary = {}
+    for section, costs in SECTION_COSTS.items():
+        lines = budget_breakdown.get(section)
+        lines = lines if isinstance(lines, dict) else {}
+        summary[f"{section}_subtotal"] = sum(_number(lines.get(cost)) or 0 for cost in costs)
+
+    total = sum(summary[field] for field in SUBTOTAL_FIELDS)
+    if not total and isinstance(payment_terms, dict):
+        # No breakdown, fall back on the total the applicant declared
+        total = _number(payment_terms.get("total_budget")) or 0
+    summary["budget_total"] = total
+
+    production_overview = production_overview if isinstance(production_overview, dict) else {}
+    shoot_days = _number(production_overview.get("expected_shoot_days"))
+    summary["expected_shoot_days"] = int(shoot_days) if shoot_days else 0
+    genre = production_overview.get("genre")
+    summary["genre"] = genre.strip()[:100] if isinstance(genre, str) else ""
+    return summary
+
+
+def apply_budget_summary(instance):
+    """Fill BUDGET_FIELDS of a FilmMaker from its JSON sections."""
+    sources = ("budget_breakdown", "payment_terms", "production_overview")
+    if set(sources) & instance.get_deferred_fields():
+        # Sections not loaded, so they aren't being written either
+        return False
+    summary = summarize_budget(*(getattr(instance, source) for source in sources))
+    for field, value in summary.items():
+        setattr(instance, field, value)
+    return True
+
+
+def _param_number(request, param):
+    value = request.GET.get(param)
+    if value in (None, ""):
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        number = math.nan
+    if not math.isfinite(number):
+        raise ValidationError({param: "Must be a number."})
+    return number
+
+
+def apply_budget_filters(request, queryset):
+    """
+    `?min_budget=&max_budget=` (budget_total), `?genre=a,b` and
+    `?ordering=[-]created_at|budget_total|expected_shoot_days|genre`, on
+    the materialized columns, so no JSON is parsed at query time.
+    """
+    min_budget = _param_number(request, "min_budget")
+    if min_budget is not None:
+        queryset = queryset.filter(budget_total__gte=min_budget)
+    max_budget = _param_number(request, "max_budget")
+    if max_budget is not None:
+        queryset = queryset.filter(budget_total__lte=max_budget)
+
+    genres = [genre.strip() for genre in request.GET.get("genre", "").split(",") if genre.strip()]
+    if genres:
+        queryset = queryset.filter(genre__in=genres)
+
+    ordering = request.GET.get("ordering")
+    if ordering:
+        field = ordering.removeprefix("-")
+        if field not in ORDERING_FIELDS:
+            raise ValidationError({"ordering": f"Use one of {', '.join(ORDERING_FIELDS)}, optionally prefixed with '-'."})
+        queryset = queryset.order_by(ordering, "-created_at", "-id")
+    return queryset
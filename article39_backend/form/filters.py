@@ -0,0 +1,65 @@
+from datetime import date, datetime, time, timedelta
+
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _day_start(request, param):
+    # Local midnight, like the dates admins see, as a bound on the
+    # created_at index rather than a per-row date conversion
+    value = request.GET.get(param)
+    if not value:
+        return None
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError({param: "Use YYYY-MM-DD."})
+    if param == "created_to":
+        day += timedelta(days=1)
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def apply_applicant_filters(request, queryset, verified_field, genre_fields=(), location_fields=()):
+    """
+    Filters shared by the applicant lists:
+    - `?created_from=&created_to=` (YYYY-MM-DD, inclusive)
+    - `?verified=true|false`: has a verified account or not, through the
+      `verified_field` relation to artist.Artist
+    - `?genre=a,b` on any of `genre_fields`
+    - `?city=a,b&country=...` (case-insensitive) on `location_fields`,
+      matched on the lower() expression indexes
+    """
+    created_from = _day_start(request, "created_from")
+    if created_from:
+        queryset = queryset.filter(created_at__gte=created_from)
+    created_to = _day_start(request, "created_to")
+    if created_to:
+        queryset = queryset.filter(created_at__lt=created_to)
+
+    verified = request.GET.get("verified")
+    if verified:
+        if verified not in ("true", "false"):
+            raise ValidationError({"verified": "Use true or false."})
+        lookup = {f"{verified_field}__is_verified": True}
+        queryset = queryset.filter(**lookup) if verified == "true" else queryset.exclude(**lookup)
+
+    genres = _split(request.GET.get("genre", ""))
+    if genres and genre_fields:
+        match = Q()
+        for field in genre_fields:
+            match |= Q(**{f"{field}__in": genres})
+        queryset = queryset.filter(match)
+
+    for field in location_fields:
+        values = _split(request.GET.get(field, ""))
+        if values:
+            queryset = queryset.alias(**{f"{field}_lower": Lower(field)}).filter(
+                **{f"{field}_lower__in": [value.lower() for value in values]}
+            )
+    return queryset
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from form.budget import BUDGET_FIELDS, apply_budget_summary
+from form.models import FilmMaker
+
+
+class Command(BaseCommand):
+    help = "Compute the budget totals, shoot days and genre columns of every film maker from its JSON sections."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        rows = []
+        sources = FilmMaker.objects.only("id", "budget_breakdown", "payment_terms", "production_overview")
+        for row in sources.iterator(chunk_size=options["batch_size"]):
+            apply_budget_summary(row)
+            rows.append(row)
+        FilmMaker.objects.bulk_update(rows, BUDGET_FIELDS, batch_size=options["batch_size"])
+        self.stdout.write(f"film makers: {len(rows)} updated")
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from form.models import Artist, FilmMaker
+from form.search import apply_name_search
+
+
+class Command(BaseCommand):
+    help = "Compute the autocomplete name_search column of every artist and film maker application."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        for model in (Artist, FilmMaker):
+            sources = {path.split("__")[0] for path in model.name_fields}
+            rows = []
+            for row in model.objects.only("id", *sources).iterator(chunk_size=options["batch_size"]):
+                apply_name_search(row)
+                rows.append(row)
+            model.objects.bulk_update(rows, ["name_search"], batch_size=options["batch_size"])
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {len(rows)} updated")
@@ -0,0 +1,111 @@
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from form.models import Artist, FilmMaker
+from form.serializers import ArtistSerializer, FilmMakerSerializer
+from renderers import ORJSONRenderer, orjson
+
+
+def _artist(i):
+    return Artist(
+        full_name_english=f"Applicant Number {i}",
+        full_name_bengali="আবেদনকারী নম্বর",
+        stage_name=f"Stage {i}",
+        date_of_birth=date(1990, 1, 1) + timedelta(days=i % 3650),
+        primary_genre="Folk",
+        secondary_genre="Rock",
+        performance_languages=["Bengali", "English"],
+        email=f"applicant{i}@example.com",
+        mobile_number="+8801700000000",
+        city="Dhaka",
+        country="Bangladesh",
+        website="https://example.com",
+        social_links=["https://facebook.com/a", "https://youtube.com/a"],
+        bio="Singer and songwriter from Dhaka. " * 20,
+        portfolio_description="Live shows, studio albums and collaborations. " * 10,
+        credits="Various",
+        content_links=["https://example.com/song1", "https://example.com/song2"],
+        content_uploads=["https://example.com/upload1"],
+        instruments=["Guitar", "Harmonium", "Dotara"],
+        technical_preferences="Two vocal mics, one DI box",
+        available_timelines=[
+            {"time": {"from": "10:00AM", "to": "12:00PM"}, "date": {"from": "20-03-2025", "to": "30-03-2025"}}
+        ],
+        government_id_upload="https://example.com/id.png",
+        consent_promotion=True,
+        agree_terms=True,
+        preferred_payment_method="bKash",
+        created_at=timezone.now(),
+    )
+
+
+def _film_maker(i, budget_lines):
+    crew = [
+        {"name": f"Crew {n}", "phone": "+8801700000000", "photo": "https://example.com/p.png",
+         "role": "Gaffer", "rate": 1500.5, "num_of_days": 12, "total_cost": 18006}
+        for n in range(budget_lines)
+    ]
+    return FilmMaker(
+        basic_info={"full_name_en": f"Film Maker {i}", "full_name_bn": "চলচ্চিত্র নির্মাতা", "email": f"fm{i}@example.com"},
+        project_info={"project_title": "A Short Film", "company_name": "Studio"},
+        primary_contact_info={"contact_name": "Producer", "email": "p@example.com", "phone": "+880"},
+        brief_synopsis="A story about the river. " * 40,
+        production_overview={"genre": "Drama", "est_runtime": 20, "expected_shoot_days": 12},
+        budget_breakdown={"talent_and_crews": {"artists": crew, "crews": crew, "overall_crew_subtotal": 1}},
+        payment_terms={"total_budget": 500000, "payment_schedule": []},
+        additional_details={"note": "", "attachments": []},
+        created_at=timezone.now(),
+    )
+
+
+class Command(BaseCommand):
+    help = "Compare JSONRenderer and ORJSONRenderer throughput on applicant list payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000, help="Artists in the list payload.")
+        parser.add_argument("--film-makers", type=int, default=500, help="Film makers in the list payload.")
+        parser.add_argument("--budget-lines", type=int, default=100, help="Crew lines per film maker budget.")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--from-db", action="store_true", help="Render the rows currently in the database instead."
+        )
+
+    def _time(self, renderer, data, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            body = renderer.render(data)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, len(body)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write("orjson is not installed, ORJSONRenderer falls back to json.")
+
+        if options["from_db"]:
+            artists = Artist.objects.all().order_by("-created_at")
+            film_makers = FilmMaker.objects.all().order_by("-created_at")
+        else:
+            artists = [_artist(i) for i in range(options["rows"])]
+            film_makers = [_film_maker(i, options["budget_lines"]) for i in range(options["film_makers"])]
+
+        payloads = {
+            "ArtistView": {"success": True, "data": ArtistSerializer(artists, many=True).data},
+            "FilmMakerView": {"success": True, "data": FilmMakerSerializer(film_makers, many=True).data},
+        }
+
+        for name, data in payloads.items():
+            rows = len(data["data"])
+            baseline, size = self._time(JSONRenderer(), data, options["repeat"])
+            fast, fast_size = self._time(ORJSONRenderer(), data, options["repeat"])
+            self.stdout.write(
+                f"{name}: {rows} rows, {size / 1024 / 1024:.1f} MB\n"
+                f"  JSONRenderer    {baseline * 1000:8.1f} ms  {rows / baseline:10.0f} rows/s\n"
+                f"  ORJSONRenderer  {fast * 1000:8.1f} ms  {rows / fast:10.0f} rows/s  "
+                f"({baseline / fast:.1f}x, {fast_size / 1024 / 1024:.1f} MB)"
+            )
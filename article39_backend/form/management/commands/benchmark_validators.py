@@ -0,0 +1,169 @@
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+
+from form.validator import validate_budget_breakdown
+
+
+# The validator the schema in form/validator.py replaced, kept verbatim as
+# the baseline. It stops at the first error.
+
+def _legacy_budget_breakdown(budget_breakdown):
+    if not isinstance(budget_breakdown, dict):
+        raise ValidationError("Budget breakdown must be a dictionary.")
+
+    pre_production = budget_breakdown.get('pre_production', {})
+    _legacy_cost_section(pre_production, ['script_writing', 'storyboarding_concept_art', 'location_scouting', 'administrative'])
+
+    talent_and_crews = budget_breakdown.get('talent_and_crews', {})
+    _legacy_artists_or_crews(talent_and_crews, 'artists', 'artist_subtotal_cost')
+    _legacy_artists_or_crews(talent_and_crews, 'crews', 'crew_subtotal')
+    _legacy_number_field(talent_and_crews, 'overall_crew_subtotal')
+
+    equipment_and_technical = budget_breakdown.get('equipment_and_technical', {})
+    _legacy_equipment_section(equipment_and_technical, 'cameras', 'camera_subtotal')
+    _legacy_cost_section(equipment_and_technical, ['lighting_equipment', 'sound_recording_equipment', 'others'])
+
+    location_and_sets = budget_breakdown.get('location_and_sets', {})
+    _legacy_cost_section(location_and_sets, ['location_rent', 'set_construct', 'production_design'])
+
+    transportation_and_logistics = budget_breakdown.get('transportation_and_logistics', {})
+    _legacy_cost_section(transportation_and_logistics, ['vehicle_rent', 'fuel', 'driver_fee'])
+
+    wardrobe_and_costumes = budget_breakdown.get('wardrobe_and_costumes', {})
+    _legacy_cost_section(wardrobe_and_costumes, ['costume_purchase', 'styling'])
+
+    catering = budget_breakdown.get('catering', {})
+    _legacy_number_field(catering, 'num_of_days')
+    _legacy_number_field(catering, 'per_day')
+    _legacy_number_field(catering, 'subtotal')
+
+    snacks_craft_services = budget_breakdown.get('snacks_craft_services', {})
+    _legacy_number_field(snacks_craft_services, 'fee')
+
+    post_production = budget_breakdown.get('post_production', {})
+    _legacy_cost_section(post_production, ['editing', 'color_grading', 'sound_design', 'music', 'additional'])
+
+    contingency_misc = budget_breakdown.get('contingency_misc', {})
+    _legacy_cost_section(contingency_misc, ['contingency_fund', 'insurance'])
+
+def _legacy_number_field(section, field):
+    value = section.get(field)
+    if not isinstance(value, (int, float)):
+        raise ValidationError(f"'{field}' must be a number.")
+
+def _legacy_cost_section(section, fields):
+    for field in fields:
+        _legacy_number_field(section, field)
+
+def _legacy_artists_or_crews(section, key, subtotal_field):
+    items = section.get(key, [])
+    if not isinstance(items, list):
+        raise ValidationError(f"'{key}' must be a list.")
+    
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValidationError(f"Each item in '{key}' must be a dictionary.")
+
+        required_fields = ['name', 'phone', 'photo', 'role', 'rate', 'num_of_days', 'total_cost']
+        for field in required_fields:
+            if field not in item:
+                raise ValidationError(f"Each item in '{key}' must include '{field}'.")
+            if field in ['rate', 'num_of_days', 'total_cost']:
+                _legacy_number_field(item, field)
+    
+    _legacy_number_field(section, subtotal_field)
+
+def _legacy_equipment_section(section, key, subtotal_field):
+    items = section.get(key, [])
+    if not isinstance(items, list):
+        raise ValidationError(f"'{key}' must be a list.")
+    
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValidationError(f"Each item in '{key}' must be a dictionary.")
+
+        required_fields = ['name', 'type', 'rate']
+        for field in required_fields:
+            if field not in item:
+                raise ValidationError(f"Each item in '{key}' must include '{field}'.")
+            if field == 'rate':
+                _legacy_number_field(item, field)
+    
+    _legacy_number_field(section, subtotal_field)
+
+
+def _budget(lines):
+    """A realistic budget with `lines` crew, artist and camera lines."""
+    def member(n):
+        return {"name": f"Crew {n}", "phone": "+8801700000000", "photo": "https://example.com/p.png",
+                "role": "Gaffer", "rate": 1500.5, "num_of_days": 12, "total_cost": 18006}
+
+    artists, crews, cameras = lines // 4, lines // 2, lines - lines // 4 - lines // 2
+    return {
+        "pre_production": {"script_writing": 50000, "storyboarding_concept_art": 20000, "location_scouting": 15000, "administrative": 5000},
+        "talent_and_crews": {
+            "artists": [member(n) for n in range(artists)],
+            "crews": [member(n) for n in range(crews)],
+            "artist_subtotal_cost": 18006 * artists, "crew_subtotal": 18006 * crews, "overall_crew_subtotal": 18006 * (artists + crews),
+        },
+        "equipment_and_technical": {
+            "cameras": [{"name": f"Camera {n}", "type": "Cinema", "rate": 25000} for n in range(cameras)],
+            "camera_subtotal": 25000 * cameras, "lighting_equipment": 40000, "sound_recording_equipment": 30000, "others": 10000,
+        },
+        "location_and_sets": {"location_rent": 60000, "set_construct": 80000, "production_design": 20000},
+        "transportation_and_logistics": {"vehicle_rent": 30000, "fuel": 10000, "driver_fee": 8000},
+        "wardrobe_and_costumes": {"costume_purchase": 25000, "styling": 10000},
+        "catering": {"num_of_days": 12, "per_day": 8000, "subtotal": 96000},
+        "snacks_craft_services": {"fee": 12000},
+        "post_production": {"editing": 60000, "color_grading": 30000, "sound_design": 25000, "music": 40000, "additional": 5000},
+        "contingency_misc": {"contingency_fund": 50000, "insurance": 20000},
+    }
+
+
+def _errors(validate, budget):
+    try:
+        validate(budget)
+    except ValidationError as e:
+        return len(e.messages)
+    return 0
+
+
+class Command(BaseCommand):
+    help = "Compare the schema validator with the one it replaced on FilmMaker budget breakdowns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lines", type=int, default=200, help="Crew, artist and camera lines per budget.")
+        parser.add_argument("--number", type=int, default=200, help="Validations per timing.")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def _time(self, validate, budget, number, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                try:
+                    validate(budget)
+                except ValidationError:
+                    pass
+            elapsed = (time.perf_counter() - start) / number
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def handle(self, *args, **options):
+        valid = _budget(options["lines"])
+        # Every fifth line has a bad rate, as when a spreadsheet column is pasted as text
+        invalid = _budget(options["lines"])
+        for member in invalid["talent_and_crews"]["crews"][::5]:
+            member["rate"] = "1500"
+
+        for name, budget in (("valid", valid), ("invalid", invalid)):
+            baseline = self._time(_legacy_budget_breakdown, budget, options["number"], options["repeat"])
+            fast = self._time(validate_budget_breakdown, budget, options["number"], options["repeat"])
+            self.stdout.write(
+                f"{name} budget, {options['lines']} lines\n"
+                f"  previous validator  {baseline * 1e6:8.1f} us  {_errors(_legacy_budget_breakdown, budget):4} errors reported\n"
+                f"  schema validator    {fast * 1e6:8.1f} us  {_errors(validate_budget_breakdown, budget):4} errors reported  "
+                f"({baseline / fast:.1f}x)"
+            )
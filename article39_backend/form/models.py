@@ -1,10 +1,14 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.core.exceptions import ValidationError
+from django.db.models.fields.json import KT
+from django.db.models.functions import Lower
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db.models import JSONField
 from uuid import uuid4
-from datetime import datetime
-from form.validator import validate_budget_breakdown
+from form.validator import FILM_MAKER_SCHEMA, film_maker_errors
+from form.budget import apply_budget_summary
+from form.search import apply_name_search
 
 
 # Singer and Musician
@@ -93,15 +97,34 @@ class Artist(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Normalized names and e-mail for the admin autocomplete, see form/search.py
+    name_search = models.TextField(blank=True, default="", editable=False)
+    name_fields = ("full_name_english", "full_name_bengali", "stage_name", "email")
+
+    class Meta:
+        # Admin list filters (see form/filters.py) and autocomplete
+        indexes = [
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["primary_genre"]),
+            models.Index(fields=["secondary_genre"]),
+            models.Index(Lower("city"), name="form_artist_city_lower"),
+            models.Index(Lower("country"), name="form_artist_country_lower"),
+            GinIndex(fields=["name_search"], opclasses=["gin_trgm_ops"], name="form_artist_name_trgm"),
+        ]
+
     def save(self, *args, **kwargs):
         if self.email == "":
             self.email = None  # Convert empty string to NULL
+        apply_name_search(self)
         super().save(*args, **kwargs)
     
     def __str__(self):
         return f"{self.full_name_english} ({self.email})"
 
 
+FILM_MAKER_EMAIL_CONSTRAINT = "filmmaker_unique_email"
+
+
 class FilmMaker(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
 
@@ -115,121 +138,63 @@ class FilmMaker(models.Model):
     additional_details = models.JSONField()
     created_at = models.DateTimeField(auto_now_add=True)
 
-    def clean(self):
-        self.validate_basic_info()
-        self.validate_project_info()
-        self.validate_primary_contact_info()
-        self.validate_production_overview()
-        self.validate_budget_breakdown()
-        self.validate_payment_terms()
-        self.validate_additional_details()
-
-    def validate_basic_info(self):
-        required_keys = [
-            "full_name_en",
-            "full_name_bn",
-            "dob",
-            "gender",
-            "email",
-            "phone",
-            "address",
-            "district",
-            "post_office",
-            "postal_code",
+    # Derived from the JSON sections on save (see form/budget.py) so the
+    # admin list can filter and sort on them
+    budget_total = models.FloatField(default=0, editable=False)
+    pre_production_subtotal = models.FloatField(default=0, editable=False)
+    talent_and_crews_subtotal = models.FloatField(default=0, editable=False)
+    equipment_and_technical_subtotal = models.FloatField(default=0, editable=False)
+    location_and_sets_subtotal = models.FloatField(default=0, editable=False)
+    transportation_and_logistics_subtotal = models.FloatField(default=0, editable=False)
+    wardrobe_and_costumes_subtotal = models.FloatField(default=0, editable=False)
+    catering_subtotal = models.FloatField(default=0, editable=False)
+    snacks_craft_services_subtotal = models.FloatField(default=0, editable=False)
+    post_production_subtotal = models.FloatField(default=0, editable=False)
+    contingency_misc_subtotal = models.FloatField(default=0, editable=False)
+    expected_shoot_days = models.IntegerField(default=0, editable=False)
+    genre = models.CharField(max_length=100, blank=True, default="", editable=False)
+
+    # Normalized names and e-mail for the admin autocomplete, see form/search.py
+    name_search = models.TextField(blank=True, default="", editable=False)
+    name_fields = ("basic_info__full_name_en", "basic_info__full_name_bn", "basic_info__email")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["budget_total"]),
+            models.Index(fields=["expected_shoot_days"]),
+            models.Index(fields=["genre"]),
+            GinIndex(fields=["name_search"], opclasses=["gin_trgm_ops"], name="form_filmmaker_name_trgm"),
+        ]
+        constraints = [
+            # One submission per e-mail, case-insensitive. Enforced by the
+            # insert itself (see save()), so concurrent submissions can't
+            # both get through and no lookup runs beforehand
+            models.UniqueConstraint(
+                Lower(KT("basic_info__email")), name=FILM_MAKER_EMAIL_CONSTRAINT
+            ),
         ]
 
-        if self.basic_info:
-            for key in required_keys:
-                if key not in self.basic_info:
-                    raise ValidationError(f"Missing '{key}' in basic_info.")
-
-            # must have an email, which is unique and valid
-            email = self.basic_info.get("email")            
-            if email:
-                if not isinstance(email, str) or "@" not in email:
-                    raise ValidationError(
-                        "The 'email' field must be a valid email address."
-                    )
-                if FilmMaker.objects.filter(basic_info__email=email).exists():
-                    raise ValidationError("The 'email' field must be unique.")
-            else:
-                raise ValidationError("The 'email' field is required.")
-
-            dob = self.basic_info.get("dob")
-            if dob:
-                try:
-                    datetime.strptime(dob, "%Y-%m-%d")
-                except ValueError:
-                    raise ValidationError(
-                        "The 'dob' field must be a valid date in YYYY-MM-DD format."
-                    )
-
-    def validate_project_info(self):
-        if self.project_info:
-            if not all(
-                key in self.project_info for key in ["project_title", "company_name"]
-            ):
-                raise ValidationError(
-                    "Project info must include 'project_title' and 'company_name'."
-                )
-
-    def validate_primary_contact_info(self):
-        if self.primary_contact_info:
-            if not all(
-                key in self.primary_contact_info
-                for key in ["contact_name", "email", "phone"]
-            ):
-                raise ValidationError(
-                    "Primary contact info must include 'contact_name', 'email', and 'phone'."
-                )
-
-    def validate_production_overview(self):
-        if self.production_overview:
-            if not all(
-                key in self.production_overview
-                for key in ["genre", "est_runtime", "expected_shoot_days"]
-            ):
-                raise ValidationError(
-                    "Production overview must include 'genre', 'est_runtime', and 'expected_shoot_days'."
-                )
-            if "locations" in self.production_overview:
-                if not all(
-                    isinstance(loc, dict) and "type" in loc and "location" in loc
-                    for loc in self.production_overview["locations"]
-                ):
-                    raise ValidationError(
-                        "Each location in production overview must be a dictionary with 'type' and 'location'."
-                    )
-
-    def validate_budget_breakdown(self):
-        if self.budget_breakdown:
-            try:
-                validate_budget_breakdown(self.budget_breakdown)
-            except ValidationError as e:
-                raise ValidationError(f"Budget Breakdown Error: {e}")
-
-    def validate_payment_terms(self):
-        if self.payment_terms:
-            if (
-                "total_budget" not in self.payment_terms
-                or "payment_schedule" not in self.payment_terms
-            ):
-                raise ValidationError(
-                    "Payment terms must include 'total_budget' and 'payment_schedule'."
-                )
-
-    def validate_additional_details(self):
-        if self.additional_details:
-            if (
-                "note" not in self.additional_details
-                or "attachments" not in self.additional_details
-            ):
-                raise ValidationError(
-                    "Additional details must include 'note' and 'attachments'."
-                )
-            if not isinstance(self.additional_details.get("attachments"), list):
-                raise ValidationError("Attachments must be a list.")
+    def clean(self):
+        # Every problem in every section at once, see form/validator.py
+        errors = film_maker_errors(
+            {field: getattr(self, field) for field in FILM_MAKER_SCHEMA}
+        )
+        if errors:
+            raise ValidationError(errors)
 
     def save(self, *args, **kwargs):
         self.clean()
-        super().save(*args, **kwargs)
+        apply_budget_summary(self)
+        apply_name_search(self)
+        try:
+            # Savepoint, a duplicate must not break the caller's transaction
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as e:
+            diag = getattr(e.__cause__, "diag", None)
+            if getattr(diag, "constraint_name", None) == FILM_MAKER_EMAIL_CONSTRAINT:
+                raise ValidationError(
+                    {"basic_info": "The 'email' field must be unique."}
+                ) from e
+            raise
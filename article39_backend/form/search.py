@@ -0,0 +1,71 @@
+import re
+import unicodedata
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+
+# Applicant name autocomplete. Each form model declares `name_fields`, the
+# values (`basic_info__email` reaches into a JSON section) folded into its
+# `name_search` column on save. The column carries a pg_trgm GIN index
+# (gin_trgm_ops), which answers both the substring and the word similarity
+# conditions of autocomplete(). Trigrams of Bengali text need the database
+# to use a UTF-8 locale, under the C locale only Latin letters count.
+
+MIN_QUERY_LENGTH = 2
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 25
+
+# Zero width joiner/non-joiner/space and BOM: Bengali keyboards insert the
+# joiners to pick conjunct shapes, they don't change the name
+INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\ufeff"))
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(text):
+    """NFC, invisible joiners dropped, casefolded, whitespace collapsed."""
+    text = unicodedata.normalize("NFC", text or "").translate(INVISIBLE)
+    return WHITESPACE.sub(" ", text.casefold()).strip()
+
+
+def _value(instance, path):
+    field, *keys = path.split("__")
+    value = getattr(instance, field)
+    for key in keys:
+        value = value.get(key) if isinstance(value, dict) else None
+    return value if isinstance(value, str) else ""
+
+
+def apply_name_search(instance):
+    """Fill `name_search` from the model's `name_fields`."""
+    sources = {path.split("__")[0] for path in instance.name_fields}
+    if sources & instance.get_deferred_fields():
+        # Names not loaded, so they aren't being written either
+        return False
+    instance.name_search = normalize_name(" ".join(_value(instance, path) for path in instance.name_fields))
+    return True
+
+
+def parse_limit(value):
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_LIMIT
+    return min(max(limit, 1), MAX_LIMIT)
+
+
+def autocomplete(queryset, query, limit):
+    """
+    Best `limit` rows of `queryset` for what the admin typed so far: rows
+    containing it, or with a word close to it (typos, missing vowel signs),
+    closest first.
+    """
+    query = normalize_name(query)
+    if len(query) < MIN_QUERY_LENGTH:
+        raise ValidationError({"q": f"Type at least {MIN_QUERY_LENGTH} characters."})
+    return (
+        queryset.filter(Q(name_search__contains=query) | Q(name_search__trigram_word_similar=query))
+        .annotate(similarity=TrigramWordSimilarity(query, "name_search"))
+        .order_by("-similarity", "-created_at")[:limit]
+    )
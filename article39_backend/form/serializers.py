@@ -1,7 +1,9 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from fieldsets import SparseFieldsetMixin
 from form.models import Artist, FilmMaker
 
-class ArtistSerializer(serializers.ModelSerializer):
+class ArtistSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     # Handling ArrayFields properly
     performance_languages = serializers.ListField(child=serializers.CharField(max_length=50), required=False)
     social_links = serializers.ListField(child=serializers.URLField(), required=False)
@@ -15,7 +17,7 @@ class ArtistSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Artist
-        fields = '__all__'
+        exclude = ['name_search']
     
     def validate_mobile_number(self, value):
         """Validate mobile number format"""
@@ -30,8 +32,16 @@ class ArtistSerializer(serializers.ModelSerializer):
         return data
 
 
-class FilmMakerSerializer(serializers.ModelSerializer):
+class FilmMakerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = FilmMaker
-        fields = '__all__'
+        exclude = ['name_search']
+
+    def create(self, validated_data):
+        # FilmMaker.save() validates the JSON sections and reports duplicate
+        # e-mails, hand those back as a 400 rather than a server error
+        try:
+            return super().create(validated_data)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(serializers.as_serializer_error(e))
 
@@ -1,8 +1,9 @@
 from django.urls import path
-from form.views import ArtistView, UploadFile, FilmMakerView
+from form.views import ArtistView, UploadFile, FilmMakerView, ApplicantAutocompleteView
 
 urlpatterns = [    
     path('artist/', ArtistView.as_view(), name='artists'),
     path('upload-file/', UploadFile.as_view(), name='upload-file'),
     path('filmmaker/', FilmMakerView.as_view(), name='filmmaker'),
+    path('autocomplete/', ApplicantAutocompleteView.as_view(), name='applicant-autocomplete'),
 ]
@@ -1,85 +1,240 @@
+from datetime import datetime
 from django.core.exceptions import ValidationError
 
+# Declarative schema of the FilmMaker JSON sections. Every node compiles,
+# once at import, into two closures: valid(value), a quick yes/no for the
+# common case of a correct submission, and check(value, path, errors),
+# which appends each problem it finds to `errors` instead of stopping at
+# the first one, so an applicant sees everything to fix in one response.
+# Lists only build item paths for the items that fail valid().
+
+_NUMBER = (int, float)
+
+
+def _at(path, key):
+    return f"{path}.{key}" if path else key
+
+
+class Field:
+    """Any value, the key just has to be present."""
+
+    default = None  # value checked when the key is missing, None: required
+
+    def compile(self):
+        return None  # nothing to check beyond presence
+
+    def compile_valid(self):
+        return None
+
+
+class Number(Field):
+    def compile(self):
+        def check(value, path, errors):
+            if not isinstance(value, _NUMBER):
+                errors.append(f"'{path}' must be a number.")
+        return check
+
+    def compile_valid(self):
+        return lambda value: isinstance(value, _NUMBER)
+
+
+class Email(Field):
+    def compile(self):
+        def check(value, path, errors):
+            if not value:
+                errors.append(f"The '{path}' field is required.")
+            elif not isinstance(value, str) or "@" not in value:
+                errors.append(f"The '{path}' field must be a valid email address.")
+        return check
+
+    def compile_valid(self):
+        return lambda value: isinstance(value, str) and "@" in value
+
+
+class Date(Field):
+    def __init__(self, date_format="%Y-%m-%d", label="YYYY-MM-DD"):
+        self.date_format = date_format
+        self.label = label
+
+    def compile(self):
+        date_format, label = self.date_format, self.label
+
+        def check(value, path, errors):
+            if not value:
+                return
+            try:
+                datetime.strptime(value, date_format)
+            except (TypeError, ValueError):
+                errors.append(f"The '{path}' field must be a valid date in {label} format.")
+        return check
+
+    def compile_valid(self):
+        check = self.compile()
+
+        def valid(value):
+            errors = []
+            check(value, "", errors)
+            return not errors
+        return valid
+
+
+class List(Field):
+    def __init__(self, item=None, default=None):
+        self.item = item or Field()
+        self.default = default
+
+    def compile(self):
+        check_item = self.item.compile()
+        item_valid = self.item.compile_valid()
+
+        def check(value, path, errors):
+            if not isinstance(value, list):
+                errors.append(f"'{path}' must be a list.")
+                return
+            if check_item is not None:
+                for i, item in enumerate(value):
+                    if not item_valid(item):
+                        check_item(item, f"{path}[{i}]", errors)
+        return check
+
+    def compile_valid(self):
+        item_valid = self.item.compile_valid()
+        if item_valid is None:
+            return lambda value: isinstance(value, list)
+        return lambda value: isinstance(value, list) and all(map(item_valid, value))
+
+
+class Object(Field):
+    def __init__(self, fields, default=None):
+        self.fields = fields
+        self.default = default
+
+    def compile(self):
+        # Split the keys by kind up front so the check is a few flat loops
+        present = tuple(key for key, spec in self.fields.items() if type(spec) is Field)
+        numbers = tuple(key for key, spec in self.fields.items() if type(spec) is Number)
+        nested = tuple(
+            (key, spec.compile(), spec.default)
+            for key, spec in self.fields.items()
+            if type(spec) not in (Field, Number)
+        )
+
+        def check(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f"'{path}' must be a dictionary." if path else "Must be a dictionary.")
+                return
+            for key in present:
+                if key not in value:
+                    errors.append(f"'{_at(path, key)}' is required.")
+            for key in numbers:
+                if not isinstance(value.get(key), _NUMBER):
+                    errors.append(f"'{_at(path, key)}' must be a number.")
+            for key, check_value, default in nested:
+                if key in value:
+                    check_value(value[key], _at(path, key), errors)
+                elif default is not None:
+                    check_value(default, _at(path, key), errors)
+                else:
+                    errors.append(f"'{_at(path, key)}' is required.")
+        return check
+
+    def compile_valid(self):
+        present = frozenset(key for key, spec in self.fields.items() if type(spec) is Field)
+        numbers = tuple(key for key, spec in self.fields.items() if type(spec) is Number)
+        nested = tuple(
+            (key, spec.compile_valid(), spec.default)
+            for key, spec in self.fields.items()
+            if type(spec) not in (Field, Number)
+        )
+
+        def valid(value):
+            if not isinstance(value, dict) or not present <= value.keys():
+                return False
+            for key in numbers:
+                if not isinstance(value.get(key), _NUMBER):
+                    return False
+            for key, value_valid, default in nested:
+                if key in value:
+                    if value_valid is not None and not value_valid(value[key]):
+                        return False
+                elif default is None or (value_valid is not None and not value_valid(default)):
+                    return False
+            return True
+        return valid
+
+
+def _costs(*keys):
+    return {key: Number() for key in keys}
+
+
+CREW_MEMBER = Object({
+    "name": Field(), "phone": Field(), "photo": Field(), "role": Field(),
+    **_costs("rate", "num_of_days", "total_cost"),
+})
+
+BUDGET_BREAKDOWN_SCHEMA = Object({
+    "pre_production": Object(_costs("script_writing", "storyboarding_concept_art", "location_scouting", "administrative")),
+    "talent_and_crews": Object({
+        "artists": List(CREW_MEMBER, default=[]),
+        "crews": List(CREW_MEMBER, default=[]),
+        **_costs("artist_subtotal_cost", "crew_subtotal", "overall_crew_subtotal"),
+    }),
+    "equipment_and_technical": Object({
+        "cameras": List(Object({"name": Field(), "type": Field(), "rate": Number()}), default=[]),
+        **_costs("camera_subtotal", "lighting_equipment", "sound_recording_equipment", "others"),
+    }),
+    "location_and_sets": Object(_costs("location_rent", "set_construct", "production_design")),
+    "transportation_and_logistics": Object(_costs("vehicle_rent", "fuel", "driver_fee")),
+    "wardrobe_and_costumes": Object(_costs("costume_purchase", "styling")),
+    "catering": Object(_costs("num_of_days", "per_day", "subtotal")),
+    "snacks_craft_services": Object(_costs("fee")),
+    "post_production": Object(_costs("editing", "color_grading", "sound_design", "music", "additional")),
+    "contingency_misc": Object(_costs("contingency_fund", "insurance")),
+})
+
+# FilmMaker field -> schema. Empty sections are not checked, as before.
+FILM_MAKER_SCHEMA = {
+    "basic_info": Object({
+        "full_name_en": Field(), "full_name_bn": Field(), "gender": Field(), "phone": Field(),
+        "address": Field(), "district": Field(), "post_office": Field(), "postal_code": Field(),
+        "email": Email(),
+        "dob": Date(),
+    }),
+    "project_info": Object({"project_title": Field(), "company_name": Field()}),
+    "primary_contact_info": Object({"contact_name": Field(), "email": Field(), "phone": Field()}),
+    "production_overview": Object({
+        "genre": Field(), "est_runtime": Field(), "expected_shoot_days": Field(),
+        "locations": List(Object({"type": Field(), "location": Field()}), default=[]),
+    }),
+    "budget_breakdown": BUDGET_BREAKDOWN_SCHEMA,
+    "payment_terms": Object({"total_budget": Field(), "payment_schedule": Field()}),
+    "additional_details": Object({"note": Field(), "attachments": List()}),
+}
+
+_budget_breakdown_valid = BUDGET_BREAKDOWN_SCHEMA.compile_valid()
+_check_budget_breakdown = BUDGET_BREAKDOWN_SCHEMA.compile()
+_film_maker_checks = tuple(
+    (field, schema.compile_valid(), schema.compile()) for field, schema in FILM_MAKER_SCHEMA.items()
+)
+
+
+def film_maker_errors(data):
+    """{field: [messages]} for every problem in the FilmMaker sections of `data`."""
+    errors = {}
+    for field, valid, check in _film_maker_checks:
+        value = data.get(field)
+        if value and not valid(value):
+            messages = []
+            check(value, "", messages)
+            if messages:
+                errors[field] = messages
+    return errors
+
+
 def validate_budget_breakdown(budget_breakdown):
-    if not isinstance(budget_breakdown, dict):
-        raise ValidationError("Budget breakdown must be a dictionary.")
-
-    pre_production = budget_breakdown.get('pre_production', {})
-    validate_cost_section(pre_production, ['script_writing', 'storyboarding_concept_art', 'location_scouting', 'administrative'])
-
-    talent_and_crews = budget_breakdown.get('talent_and_crews', {})
-    validate_artists_or_crews(talent_and_crews, 'artists', 'artist_subtotal_cost')
-    validate_artists_or_crews(talent_and_crews, 'crews', 'crew_subtotal')
-    validate_number_field(talent_and_crews, 'overall_crew_subtotal')
-
-    equipment_and_technical = budget_breakdown.get('equipment_and_technical', {})
-    validate_equipment_section(equipment_and_technical, 'cameras', 'camera_subtotal')
-    validate_cost_section(equipment_and_technical, ['lighting_equipment', 'sound_recording_equipment', 'others'])
-
-    location_and_sets = budget_breakdown.get('location_and_sets', {})
-    validate_cost_section(location_and_sets, ['location_rent', 'set_construct', 'production_design'])
-
-    transportation_and_logistics = budget_breakdown.get('transportation_and_logistics', {})
-    validate_cost_section(transportation_and_logistics, ['vehicle_rent', 'fuel', 'driver_fee'])
-
-    wardrobe_and_costumes = budget_breakdown.get('wardrobe_and_costumes', {})
-    validate_cost_section(wardrobe_and_costumes, ['costume_purchase', 'styling'])
-
-    catering = budget_breakdown.get('catering', {})
-    validate_number_field(catering, 'num_of_days')
-    validate_number_field(catering, 'per_day')
-    validate_number_field(catering, 'subtotal')
-
-    snacks_craft_services = budget_breakdown.get('snacks_craft_services', {})
-    validate_number_field(snacks_craft_services, 'fee')
-
-    post_production = budget_breakdown.get('post_production', {})
-    validate_cost_section(post_production, ['editing', 'color_grading', 'sound_design', 'music', 'additional'])
-
-    contingency_misc = budget_breakdown.get('contingency_misc', {})
-    validate_cost_section(contingency_misc, ['contingency_fund', 'insurance'])
-
-def validate_number_field(section, field):
-    value = section.get(field)
-    if not isinstance(value, (int, float)):
-        raise ValidationError(f"'{field}' must be a number.")
-
-def validate_cost_section(section, fields):
-    for field in fields:
-        validate_number_field(section, field)
-
-def validate_artists_or_crews(section, key, subtotal_field):
-    items = section.get(key, [])
-    if not isinstance(items, list):
-        raise ValidationError(f"'{key}' must be a list.")
-    
-    for item in items:
-        if not isinstance(item, dict):
-            raise ValidationError(f"Each item in '{key}' must be a dictionary.")
-
-        required_fields = ['name', 'phone', 'photo', 'role', 'rate', 'num_of_days', 'total_cost']
-        for field in required_fields:
-            if field not in item:
-                raise ValidationError(f"Each item in '{key}' must include '{field}'.")
-            if field in ['rate', 'num_of_days', 'total_cost']:
-                validate_number_field(item, field)
-    
-    validate_number_field(section, subtotal_field)
-
-def validate_equipment_section(section, key, subtotal_field):
-    items = section.get(key, [])
-    if not isinstance(items, list):
-        raise ValidationError(f"'{key}' must be a list.")
-    
-    for item in items:
-        if not isinstance(item, dict):
-            raise ValidationError(f"Each item in '{key}' must be a dictionary.")
-
-        required_fields = ['name', 'type', 'rate']
-        for field in required_fields:
-            if field not in item:
-                raise ValidationError(f"Each item in '{key}' must include '{field}'.")
-            if field == 'rate':
-                validate_number_field(item, field)
-    
-    validate_number_field(section, subtotal_field)
\ No newline at end of file
+    if _budget_breakdown_valid(budget_breakdown):
+        return
+    errors = []
+    _check_budget_breakdown(budget_breakdown, "", errors)
+    if errors:
+        raise ValidationError(errors)
@@ -1,4 +1,5 @@
 from rest_framework import status
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from .models import Artist, FilmMaker
@@ -7,9 +8,36 @@ import cloudinary
 import cloudinary.uploader
 from cloudinary.utils import cloudinary_url
 from django.conf import settings
+from fieldsets import sparse_queryset
+from form.budget import apply_budget_filters
+from form.filters import apply_applicant_filters
+from form.search import autocomplete, parse_limit
+from exports import EXPORT_RENDERER_CLASSES, export_response, wants_export
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    page_query_param = "p"
+
+    def get_paginated_response(self, data):
+        # Rows stay under "data", as before the lists were paginated
+        return Response(
+            {
+                "success": True,
+                "count": self.page.paginator.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "data": data,
+            },
+            status=status.HTTP_200_OK,
+        )
 
 
 class ArtistView(APIView):
+    # ?format=csv|ndjson streams every applicant, see exports.py
+    renderer_classes = EXPORT_RENDERER_CLASSES
 
     def get(self, request, *args, **kwargs):
         artist_id = request.GET.get("id", None)
@@ -17,8 +45,8 @@ class ArtistView(APIView):
         if artist_id:
             # Retrieve a single artist by ID
             try:
-                artist = Artist.objects.get(id=artist_id)
-                serializer = ArtistSerializer(artist)
+                artist = sparse_queryset(request, Artist.objects.all(), ArtistSerializer).get(id=artist_id)
+                serializer = ArtistSerializer(artist, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Artist.DoesNotExist:
                 return Response(
@@ -26,12 +54,22 @@ class ArtistView(APIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
         else:
-            # Retrieve all artists
-            artists = Artist.objects.all().order_by("-created_at")
-            serializer = ArtistSerializer(artists, many=True)
-            return Response(
-                {"success": True, "data": serializer.data}, status=status.HTTP_200_OK
+            # Retrieve artists, a page at a time (?p=&page_size=) or every
+            # match with ?format=csv|ndjson. Filters: see form/filters.py
+            artists = apply_applicant_filters(
+                request,
+                Artist.objects.all().order_by("-created_at", "-id"),
+                "artist_info",
+                genre_fields=("primary_genre", "secondary_genre"),
+                location_fields=("city", "country"),
             )
+            artists = sparse_queryset(request, artists, ArtistSerializer)
+            if wants_export(request):
+                return export_response(request, artists, ArtistSerializer, "artists")
+            paginator = StandardResultsSetPagination()
+            page = paginator.paginate_queryset(artists, request)
+            serializer = ArtistSerializer(page, many=True, context={"request": request})
+            return paginator.get_paginated_response(serializer.data)
 
     def post(self, request):
         serializer = ArtistSerializer(data=request.data)
@@ -43,6 +81,9 @@ class ArtistView(APIView):
 
 
 class FilmMakerView(APIView):
+    # ?format=csv|ndjson streams every applicant, see exports.py
+    renderer_classes = EXPORT_RENDERER_CLASSES
+
     def post(self, request):
         serializer = FilmMakerSerializer(data=request.data)
         if serializer.is_valid(raise_exception=True):
@@ -59,8 +100,8 @@ class FilmMakerView(APIView):
         film_maker_id = request.GET.get("id", None)
         if film_maker_id:
             try:
-                film_maker = FilmMaker.objects.get(id=film_maker_id)
-                serializer = FilmMakerSerializer(film_maker)
+                film_maker = sparse_queryset(request, FilmMaker.objects.all(), FilmMakerSerializer).get(id=film_maker_id)
+                serializer = FilmMakerSerializer(film_maker, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK) 
             except FilmMaker.DoesNotExist:
                 return Response(
@@ -68,12 +109,68 @@ class FilmMakerView(APIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
         else:
-            film_makers = FilmMaker.objects.all().order_by("-created_at")
-            serializer = FilmMakerSerializer(film_makers, many=True)
+            # Paginated like ArtistView. ?min_budget=&max_budget=&genre=&ordering=
+            # see form/budget.py, the other filters form/filters.py
+            film_makers = apply_budget_filters(request, FilmMaker.objects.all().order_by("-created_at", "-id"))
+            film_makers = apply_applicant_filters(request, film_makers, "filmmaker_info")
+            film_makers = sparse_queryset(request, film_makers, FilmMakerSerializer)
+            if wants_export(request):
+                return export_response(request, film_makers, FilmMakerSerializer, "film_makers")
+            paginator = StandardResultsSetPagination()
+            page = paginator.paginate_queryset(film_makers, request)
+            serializer = FilmMakerSerializer(page, many=True, context={"request": request})
+            return paginator.get_paginated_response(serializer.data)
+
+
+class ApplicantAutocompleteView(APIView):
+    # ?q=<what the admin typed>&type=artist|filmmaker&limit=, matches on
+    # names and e-mail of both application forms, see form/search.py
+    def get(self, request, *args, **kwargs):
+        if not (request.user and request.user.is_authenticated and request.user.is_admin):
+            return Response(
+                {"success": False, "message": "You are not authorized to perform this action"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        query = request.GET.get("q", "")
+        limit = parse_limit(request.GET.get("limit"))
+        applicant_type = request.GET.get("type")
+        if applicant_type not in (None, "", "artist", "filmmaker"):
             return Response(
-                {"success": True, "data": serializer.data}, status=status.HTTP_200_OK
+                {"success": False, "message": "type must be artist or filmmaker"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
+        matches = []
+        if applicant_type in (None, "", "artist"):
+            artists = Artist.objects.only("id", "full_name_english", "full_name_bengali", "stage_name", "email", "created_at")
+            for artist in autocomplete(artists, query, limit):
+                matches.append({
+                    "type": "artist",
+                    "id": artist.id,
+                    "name": artist.full_name_english,
+                    "name_bn": artist.full_name_bengali,
+                    "stage_name": artist.stage_name,
+                    "email": artist.email,
+                    "similarity": artist.similarity,
+                })
+        if applicant_type in (None, "", "filmmaker"):
+            film_makers = FilmMaker.objects.only("id", "basic_info", "created_at")
+            for film_maker in autocomplete(film_makers, query, limit):
+                matches.append({
+                    "type": "filmmaker",
+                    "id": film_maker.id,
+                    "name": film_maker.basic_info.get("full_name_en"),
+                    "name_bn": film_maker.basic_info.get("full_name_bn"),
+                    "stage_name": None,
+                    "email": film_maker.basic_info.get("email"),
+                    "similarity": film_maker.similarity,
+                })
+
+        matches.sort(key=lambda match: match["similarity"], reverse=True)
+        return Response(
+            {"success": True, "data": matches[:limit]}, status=status.HTTP_200_OK
+        )
+
 
 class UploadFile(APIView):
     # Upload raw file via cloudinary
@@ -0,0 +1,128 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+KEY_PREFIX = "pdf"
+
+# Per worker process: WeasyPrint's font configuration, and every stylesheet
+# compiled so far keyed by the hash of its text. Filled by _init_worker and
+# reused by every job the process runs.
+_worker_state = {}
+
+
+def _init_worker(niceness):
+    from weasyprint import CSS  # noqa: F401, imported once per worker
+    from weasyprint.text.fonts import FontConfiguration
+
+    # Renders are background work, request handling comes first
+    os.nice(niceness)
+    _worker_state["fonts"] = FontConfiguration()
+    _worker_state["stylesheets"] = {}
+
+
+def _stylesheet(css):
+    from weasyprint import CSS
+
+    digest = hashlib.sha256(css.encode()).hexdigest()
+    if digest not in _worker_state["stylesheets"]:
+        _worker_state["stylesheets"][digest] = CSS(string=css, font_config=_worker_state["fonts"])
+    return _worker_state["stylesheets"][digest]
+
+
+def _render_batch(documents):
+    """Runs in a worker: render (html, stylesheets) pairs, return (pdf bytes, seconds) pairs."""
+    from weasyprint import HTML
+
+    results = []
+    for html, stylesheets in documents:
+        began = time.perf_counter()
+        pdf = HTML(string=html).write_pdf(
+            stylesheets=[_stylesheet(css) for css in stylesheets],
+            font_config=_worker_state["fonts"],
+        )
+        results.append((pdf, time.perf_counter() - began))
+    return results
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(reset=False):
+    global _pool
+    with _pool_lock:
+        if reset and _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None:
+            # spawn: workers must not inherit the parent's database
+            # connections and threads
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDER_WORKERS,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(settings.PDF_RENDER_NICENESS,),
+            )
+        return _pool
+
+
+def _stats_key(metric):
+    return f"{KEY_PREFIX}:stats:{metric}"
+
+
+def _incr(key, delta=1):
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def get_pdf_stats():
+    metrics = ("jobs", "renders", "failures", "render_ms", "max_render_ms")
+    values = cache.get_many([_stats_key(metric) for metric in metrics])
+    stats = {metric: values.get(_stats_key(metric), 0) for metric in metrics}
+    stats["avg_render_ms"] = round(stats["render_ms"] / stats["renders"], 1) if stats["renders"] else None
+    return stats
+
+
+def _record_renders(timings):
+    _incr(_stats_key("jobs"))
+    _incr(_stats_key("renders"), len(timings))
+    render_ms = [round(seconds * 1000) for seconds in timings]
+    _incr(_stats_key("render_ms"), sum(render_ms))
+    # Not atomic, good enough for a high-water mark
+    if max(render_ms) > (cache.get(_stats_key("max_render_ms")) or 0):
+        cache.set(_stats_key("max_render_ms"), max(render_ms), timeout=None)
+
+
+def render_pdfs(documents):
+    """
+    Render a list of HTML documents to PDF bytes in one job on the worker
+    pool. Each document is an HTML string or a dict with "content" and
+    optional "stylesheets" (CSS strings, compiled once per worker). Output
+    isn't cached: documents carry booking ids, so none is rendered twice.
+    """
+    documents = [
+        (document, []) if isinstance(document, str) else (document["content"], document.get("stylesheets", []))
+        for document in documents
+    ]
+    try:
+        try:
+            results = _get_pool().submit(_render_batch, documents).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM on a huge document), start a fresh pool once
+            results = _get_pool(reset=True).submit(_render_batch, documents).result()
+    except Exception:
+        _incr(_stats_key("failures"))
+        raise
+    _record_renders([seconds for _, seconds in results])
+    return [pdf for pdf, _ in results]
@@ -9,8 +9,7 @@ import threading
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 from article39_backend.settings import EMAIL_HOST_USER
-from django.template.loader import render_to_string
-from weasyprint import HTML
+from pdf_rendering import render_pdfs
 
 
 # This function is used to send HTML emails with optional attachments.
@@ -38,10 +37,9 @@ class EmailThread(threading.Thread):
                         attachment_name, attachment_content, attachment_mime_type
                     )
 
-        # Attaching PDFs
+        # Attaching PDFs, rendered together as one job on the PDF worker pool
         if self.pdfs is not None:
-            for pdf in self.pdfs:
-                pdf_data = HTML(string=pdf["content"]).write_pdf()
+            for pdf, pdf_data in zip(self.pdfs, render_pdfs(self.pdfs)):
                 msg.attach(pdf["name"], pdf_data, "application/pdf")
 
         msg.content_subtype = "html"
@@ -105,6 +103,46 @@ def send_song_status_update(
     ).start()
 
 
+class TicketConfirmationThread(EmailThread):
+    # Templates and the PDF are rendered here, off the request thread
+    def __init__(self, booking):
+        self.booking = booking
+        super().__init__(None, None, [booking.buyer_email], EMAIL_HOST_USER)
+
+    def run(self):
+        booking = self.booking
+        event = booking.event
+        # One PDF for the booking, a page per ticket
+        self.pdfs = [
+            {
+                "name": f"tickets-{booking.id}.pdf",
+                "content": render_to_string(
+                    "website_emails/ticket_pdf.html",
+                    {
+                        "booking": booking,
+                        "event": event,
+                        "ticket_numbers": range(1, booking.number_of_tickets + 1),
+                    },
+                ),
+                "stylesheets": [render_to_string("website_emails/ticket.css")],
+            }
+        ]
+        self.html_content = render_to_string(
+            "website_emails/ticket_confirmation.html",
+            {
+                "buyer_name": booking.buyer_name,
+                "event": event,
+                "number_of_tickets": booking.number_of_tickets,
+                "booking_id": booking.id,
+            },
+        )
+        self.subject = f"Your tickets - {event.title}"
+        super().run()
+
+
+def send_ticket_confirmation(booking):
+    TicketConfirmationThread(booking).start()
+
 def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
 
@@ -0,0 +1,78 @@
+import calendar
+from datetime import date, datetime
+
+from django.apps import apps
+from django.db import connection
+from django.db.backends.postgresql.psycopg_any import DateRange
+from rest_framework.exceptions import ValidationError
+
+
+def _range_model():
+    return apps.get_model("website", "ShowBookingDateRange")
+
+
+def to_date_range(item):
+    # Items already passed validate_show_bookings_date_range; both ends are
+    # booked days, so the range is inclusive
+    start = datetime.fromisoformat(item["start_date"]).date()
+    end = datetime.fromisoformat(item["end_date"]).date()
+    return DateRange(start, end, "[]")
+
+
+def sync_date_ranges(bookings):
+    """Rewrite the ShowBookingDateRange rows of the given bookings from their `dates` JSON."""
+    model = _range_model()
+    model.objects.filter(booking__in=[booking.pk for booking in bookings]).delete()
+    model.objects.bulk_create(
+        [
+            model(booking_id=booking.pk, period=to_date_range(item))
+            for booking in bookings
+            for item in booking.dates
+        ]
+    )
+
+
+def parse_month(value):
+    try:
+        month = datetime.strptime(value, "%Y-%m").date()
+    except (TypeError, ValueError):
+        raise ValidationError({"month": "Use YYYY-MM."})
+    last_day = calendar.monthrange(month.year, month.month)[1]
+    return month, date(month.year, month.month, last_day)
+
+
+def parse_date(value, param):
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError({param: "Use YYYY-MM-DD."})
+
+
+def booked_dates(start, end):
+    """
+    Days between start and end (inclusive) covered by at least one booking,
+    with the number of bookings on each. The `&&` filter is answered by the
+    GiST index, only the matching ranges are expanded into days.
+    """
+    table = connection.ops.quote_name(_range_model()._meta.db_table)
+    sql = (
+        f"SELECT day::date, COUNT(DISTINCT r.booking_id) FROM {table} r "
+        "CROSS JOIN LATERAL generate_series("
+        "GREATEST(lower(r.period), %s::date), LEAST(upper(r.period) - 1, %s::date), interval '1 day'"
+        ") AS day "
+        "WHERE r.period && daterange(%s::date, %s::date, '[]') "
+        "GROUP BY day ORDER BY day"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [start, end, start, end])
+        return {day.isoformat(): count for day, count in cursor.fetchall()}
+
+
+def overlapping_bookings(start, end):
+    """Ids of the bookings with a range overlapping [start, end], from the GiST index."""
+    return list(
+        _range_model()
+        .objects.filter(period__overlap=DateRange(start, end, "[]"))
+        .values_list("booking_id", flat=True)
+        .distinct()
+    )
@@ -0,0 +1,157 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .models import Albums, CouraselImages, Singles, Stories
+from .images import queue_variants, reset_variants
+from .reading import SUMMARY_FIELDS, apply_summary
+from .schedule import apply_schedule
+from .search import update_search_vectors
+from .serializers import AlbumsSerializer, CouraselImagesSerializer, SinglesSerializer, StoriesSerializer
+
+
+# Resource -> (model, serializer) of the web-api/<resource>/batch/ endpoints
+BATCH_RESOURCES = {
+    "courasel_images": (CouraselImages, CouraselImagesSerializer),
+    "stories": (Stories, StoriesSerializer),
+    "albums": (Albums, AlbumsSerializer),
+    "singles": (Singles, SinglesSerializer),
+}
+
+OPERATIONS = ("create", "update", "delete")
+
+
+def _list(data, operation):
+    items = data.get(operation, []) if hasattr(data, "get") else None
+    if not isinstance(items, list):
+        raise ValidationError({operation: "Must be a list."})
+    return items
+
+
+def _flatten(prefix, errors):
+    # {"title": ["..."]} -> {"create[0].title": ["..."]}, one line per field
+    # once custom_exception_handler joins them
+    return {f"{prefix}.{field}": messages for field, messages in errors.items()}
+
+
+def _parse_ids(model, object_ids):
+    parsed = []
+    for object_id in object_ids:
+        try:
+            parsed.append(model._meta.pk.to_python(object_id))
+        except DjangoValidationError:
+            continue
+    return [object_id for object_id in parsed if object_id]
+
+
+def _validate(model, serializer_class, data):
+    """
+    Validate every operation before anything is written. Returns
+    (create, update, delete): validated data to insert, (instance, changed
+    fields) pairs and the ids to delete. Raises one ValidationError listing
+    every problem.
+    """
+    items = {operation: _list(data, operation) for operation in OPERATIONS}
+    total = sum(len(operation_items) for operation_items in items.values())
+    if total > settings.WEBSITE_BATCH_MAX_OPERATIONS:
+        raise ValidationError(
+            {"batch": f"At most {settings.WEBSITE_BATCH_MAX_OPERATIONS} operations per request, got {total}."}
+        )
+
+    errors = {}
+    update_ids = [item.get("id") if isinstance(item, dict) else None for item in items["update"]]
+    delete_ids = items["delete"]
+    # Malformed ids are reported as not found with the operation they came with.
+    # Whole rows (no default deferrals), the response serializes them in full.
+    existing = model._base_manager.in_bulk(_parse_ids(model, update_ids + delete_ids))
+    # in_bulk() keys are UUIDs, the request has strings
+    existing = {str(pk): instance for pk, instance in existing.items()}
+
+    create = []
+    for index, item in enumerate(items["create"]):
+        serializer = serializer_class(data=item)
+        if serializer.is_valid():
+            create.append(serializer.validated_data)
+        else:
+            errors.update(_flatten(f"create[{index}]", serializer.errors))
+
+    update = []
+    seen = set()
+    for index, (item, object_id) in enumerate(zip(items["update"], update_ids)):
+        if str(object_id) not in existing:
+            errors[f"update[{index}].id"] = "Not found." if object_id else "This field is required."
+            continue
+        if str(object_id) in seen:
+            errors[f"update[{index}].id"] = "Updated more than once."
+            continue
+        seen.add(str(object_id))
+        instance = existing[str(object_id)]
+        serializer = serializer_class(instance, data=item, partial=True)
+        if serializer.is_valid():
+            for field, value in serializer.validated_data.items():
+                setattr(instance, field, value)
+            update.append((instance, set(serializer.validated_data)))
+        else:
+            errors.update(_flatten(f"update[{index}]", serializer.errors))
+
+    for index, object_id in enumerate(delete_ids):
+        if str(object_id) not in existing:
+            errors[f"delete[{index}]"] = "Not found."
+        elif str(object_id) in seen:
+            errors[f"delete[{index}]"] = "Updated and deleted in the same request."
+
+    if errors:
+        raise ValidationError(errors)
+    return create, update, [existing[str(object_id)].pk for object_id in delete_ids]
+
+
+def apply_batch(resource, data):
+    """
+    Run a batch of create/update/delete operations on one website resource
+    with one bulk_create, one bulk_update and one DELETE in a single
+    transaction. Nothing is written unless every operation is valid.
+
+    bulk_create/bulk_update skip Model.save(), so what save() maintains
+    (updated_at, starts_at/ends_at, excerpts, search vectors, image
+    variants) is done here for the whole batch. Returns (created, updated,
+    deleted ids).
+    """
+    model, serializer_class = BATCH_RESOURCES[resource]
+    create, update, delete_ids = _validate(model, serializer_class, data)
+
+    created = [model(**validated_data) for validated_data in create]
+    updated = [instance for instance, _ in update]
+    fields = set().union(*(changed for _, changed in update))
+    if updated:
+        # auto_now is only applied by save()
+        now = timezone.now()
+        for instance in updated:
+            instance.updated_at = now
+        fields.add("updated_at")
+    if hasattr(model, "schedule_fields"):
+        for instance in created + updated:
+            apply_schedule(instance)
+        fields.update(["starts_at", "ends_at"])
+    if hasattr(model, "summary_field"):
+        for instance in created + [instance for instance, changed in update if model.summary_field in changed]:
+            apply_summary(instance)
+        if model.summary_field in fields:
+            fields.update(SUMMARY_FIELDS)
+    new_images = [instance for instance in created + updated if reset_variants(instance)]
+    if any(instance in updated for instance in new_images):
+        fields.add("image_variants")
+
+    with transaction.atomic():
+        if delete_ids:
+            model.objects.filter(pk__in=delete_ids).delete()
+        if created:
+            model.objects.bulk_create(created)
+        if updated:
+            model.objects.bulk_update(updated, sorted(fields))
+        if hasattr(model, "search_document"):
+            update_search_vectors(model, [instance.pk for instance in created + updated])
+        for instance in new_images:
+            queue_variants(instance)
+    return created, updated, delete_ids
@@ -0,0 +1,108 @@
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import IntegerField
+
+from .models import Events, TicketBookings
+from .rollups import add_ticket_sales, ticket_sale_deltas
+
+
+class BookingError(Exception):
+    """A reservation that can't be honoured; the message is safe to show the buyer."""
+
+
+def reserve_seats(event_id, seats):
+    """
+    Take `seats` off the event in one conditional UPDATE. The row lock it
+    takes is held until the surrounding transaction ends, so concurrent
+    buyers queue on the row instead of reading the same count and
+    overselling. Unlimited events (NULL remaining_seats) always match.
+    """
+    updated = (
+        Events.objects.filter(Q(remaining_seats__isnull=True) | Q(remaining_seats__gte=seats), id=event_id)
+        .update(remaining_seats=F("remaining_seats") - seats)
+    )
+    if not updated:
+        if not Events.objects.filter(id=event_id).exists():
+            raise BookingError("Event not found")
+        raise BookingError("Not enough seats left")
+
+
+def release_seats(event_id, seats):
+    Events.objects.filter(id=event_id, remaining_seats__isnull=False).update(
+        remaining_seats=F("remaining_seats") + seats
+    )
+
+
+def book_tickets(serializer):
+    """Save a validated TicketBookingsSerializer, only if the seats could be reserved."""
+    data = serializer.validated_data
+    with transaction.atomic():
+        # Insert first and take the contended event row lock last, so it is
+        # held only for the commit; a failed reservation rolls the insert back
+        booking = serializer.save()
+        reserve_seats(data["event"].pk, data["number_of_tickets"])
+        add_ticket_sales(ticket_sale_deltas([booking]))
+        return booking
+
+
+def update_booking(booking_id, validated_data):
+    """Apply a (partial) booking update, moving seats when the event or ticket count changes."""
+    with transaction.atomic():
+        booking = TicketBookings.objects.select_for_update().get(id=booking_id)
+        event_id = validated_data["event"].pk if "event" in validated_data else booking.event_id
+        seats = validated_data.get("number_of_tickets", booking.number_of_tickets)
+        if event_id != booking.event_id or seats != booking.number_of_tickets:
+            # Lock the two event rows in pk order, so updates moving bookings
+            # in opposite directions can't deadlock. On one event the old
+            # seats go back first, for the new count to fit.
+            if event_id == booking.event_id or booking.event_id < event_id:
+                release_seats(booking.event_id, booking.number_of_tickets)
+                reserve_seats(event_id, seats)
+            else:
+                reserve_seats(event_id, seats)
+                release_seats(booking.event_id, booking.number_of_tickets)
+            # The booking leaves its old event and joins the new one (the
+            # same event when only the ticket count changed)
+            deltas = ticket_sale_deltas([booking], sign=-1)
+            count, tickets = deltas.get(event_id, (0, 0))
+            deltas[event_id] = (count + 1, tickets + seats)
+            add_ticket_sales(deltas)
+        for field, value in validated_data.items():
+            setattr(booking, field, value)
+        booking.save()
+        return booking
+
+
+def cancel_booking(booking_id):
+    with transaction.atomic():
+        booking = TicketBookings.objects.select_for_update().get(id=booking_id)
+        booking.delete()
+        release_seats(booking.event_id, booking.number_of_tickets)
+        add_ticket_sales(ticket_sale_deltas([booking], sign=-1))
+
+
+def parse_capacity(value):
+    # Blank or null capacity means unlimited
+    if value in (None, ""):
+        return None
+    try:
+        return IntegerField(min_value=0).run_validation(value)
+    except ValidationError as e:
+        raise ValidationError({"capacity": e.detail})
+
+
+def set_capacity(event, capacity):
+    """
+    Change an event's capacity, recomputing remaining seats from the tickets
+    sold. The event row is locked so no booking lands in between.
+    """
+    with transaction.atomic():
+        locked = Events.objects.select_for_update().get(id=event.pk)
+        sold = locked.ticketbookings_set.aggregate(total=Sum("number_of_tickets"))["total"] or 0
+        if capacity is not None and capacity < sold:
+            raise BookingError(f"{sold} tickets are already sold")
+        remaining_seats = None if capacity is None else capacity - sold
+        Events.objects.filter(id=event.pk).update(capacity=capacity, remaining_seats=remaining_seats)
+    event.capacity = capacity
+    event.remaining_seats = remaining_seats
@@ -0,0 +1,187 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from .schedule import upcoming_cutoff
+from .snapshots import publish
+
+
+# Resources served by the public web-api/ views. Every cached response is
+# stored under the current version of its resource, and the write paths bump
+# that version, so an edit makes all older entries unreachable at once.
+RESOURCES = [
+    "courasel_images",
+    "stories",
+    "events",
+    "albums",
+    "singles",
+    "shows",
+    "exhibitions",
+]
+
+# Responses composed from several resources, cached as one entry that is
+# invalidated when any of its parts changes.
+COMPOSITES = {
+    "home": RESOURCES,
+    "search": ["stories", "events", "exhibitions", "albums"],
+}
+
+KEY_PREFIX = "web"
+
+
+def _version_key(resource):
+    return f"{KEY_PREFIX}:{resource}:version"
+
+
+def _changed_at_key(resource):
+    return f"{KEY_PREFIX}:{resource}:changed_at"
+
+
+def _stats_key(resource, outcome):
+    return f"{KEY_PREFIX}:{resource}:stats:{outcome}"
+
+
+def _initial_version():
+    # Start from the clock rather than 1: if a version key is ever evicted,
+    # re-creating it must not land on a number that old entries still use.
+    return int(time.time() * 1000)
+
+
+def get_version(resource):
+    version = cache.get(_version_key(resource))
+    if version is None:
+        cache.add(_version_key(resource), _initial_version(), timeout=None)
+        version = cache.get(_version_key(resource))
+    return version
+
+
+def get_versions(resources):
+    keys = {_version_key(resource): resource for resource in resources}
+    found = cache.get_many(keys.keys())
+    return [
+        found[key] if key in found else get_version(resource)
+        for key, resource in keys.items()
+    ]
+
+
+def bump_version(resource):
+    # Deletes don't move max(updated_at), so remember when the last write
+    # happened for Last-Modified (see website/conditional.py)
+    cache.set(_changed_at_key(resource), time.time(), timeout=None)
+    try:
+        return cache.incr(_version_key(resource))
+    except ValueError:
+        # Key missing (first write or evicted), a fresh clock value is
+        # always newer than anything stored before.
+        cache.set(_version_key(resource), _initial_version(), timeout=None)
+
+
+def get_changed_at(resources):
+    found = cache.get_many([_changed_at_key(resource) for resource in resources])
+    return max(found.values(), default=None)
+
+
+def cache_params(params):
+    # Same params in a different order must hit the same entry
+    items = sorted((key, params.getlist(key)) for key in params.keys())
+    if params.get("upcoming") == "true":
+        # The answer moves with the clock, one entry per cutoff hour
+        items.append(("upcoming_cutoff", upcoming_cutoff().isoformat()))
+    return items
+
+
+def build_cache_key(resource, params):
+    digest = hashlib.md5(repr(cache_params(params)).encode()).hexdigest()
+    versions = get_versions(COMPOSITES.get(resource, [resource]))
+    return f"{KEY_PREFIX}:{resource}:v{'.'.join(map(str, versions))}:{digest}"
+
+
+def _record(resource, outcome):
+    key = _stats_key(resource, outcome)
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_stats():
+    keys = {
+        _stats_key(resource, outcome): (resource, outcome)
+        for resource in [*RESOURCES, *COMPOSITES]
+        for outcome in ("hits", "misses")
+    }
+    values = cache.get_many(keys.keys())
+    stats = {resource: {"hits": 0, "misses": 0} for resource in [*RESOURCES, *COMPOSITES]}
+    for key, (resource, outcome) in keys.items():
+        stats[resource][outcome] = values.get(key, 0)
+    return stats
+
+
+def cached_get(resource):
+    """Read-through cache for a GET handler, keyed by resource version and query params."""
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key = build_cache_key(resource, request.GET)
+            # Snapshot renders must reflect the rows, not an earlier entry
+            cached = None if getattr(request, "publishing_snapshot", False) else cache.get(key)
+            if cached is not None:
+                _record(resource, "hits")
+                data, status_code = cached
+                response = Response(data, status=status_code)
+                # Same data renders the same bytes, see compression.py
+                response.compression_key = f"{key}:{request.accepted_renderer.format}"
+                return response
+
+            _record(resource, "misses")
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(
+                    key,
+                    (response.data, response.status_code),
+                    settings.WEBSITE_CACHE_TIMEOUT,
+                )
+                response.compression_key = f"{key}:{request.accepted_renderer.format}"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _written_ids(request, response):
+    if hasattr(response, "written_ids"):
+        # Batch writes list every row they touched
+        return response.written_ids
+    # put/delete take the id from the query string (or the body for
+    # courasel images), post returns it in the created object
+    object_id = request.GET.get("id")
+    if not object_id and hasattr(request.data, "get"):
+        object_id = request.data.get("id")
+    if not object_id and isinstance(response.data, dict):
+        data = response.data.get("data", response.data)
+        object_id = data.get("id") if isinstance(data, dict) else None
+    return [object_id] if object_id else []
+
+
+def invalidates(resource):
+    """Bump the resource version and republish its snapshots after a successful write."""
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code < 400:
+                bump_version(resource)
+                publish(resource, _written_ids(request, response))
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,84 @@
+import hashlib
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+from .cache import COMPOSITES, build_cache_key, cache_params, get_changed_at, get_versions
+
+
+def _list_validators(models):
+    # One aggregate per table: (max(updated_at), count). Edits move the max,
+    # inserts and deletes move the count.
+    parts = []
+    for model in models:
+        aggregate = model.objects.aggregate(last=Max("updated_at"), total=Count("id"))
+        parts.append((aggregate["last"], aggregate["total"]))
+    last_modified = max((last for last, _ in parts if last), default=None)
+    return parts, last_modified
+
+
+def _detail_validators(model, object_id):
+    try:
+        updated_at = model.objects.filter(id=object_id).values_list("updated_at", flat=True).first()
+    except ValidationError:
+        # Malformed id, let the view answer with its usual 404
+        return None, None
+    if updated_at is None:
+        return None, None
+    return [(updated_at,)], updated_at
+
+
+def _compute_validators(resource, models, detail, request):
+    object_id = request.GET.get("id") if detail else None
+    if object_id:
+        parts, last_modified = _detail_validators(models[0], object_id)
+    else:
+        parts, last_modified = _list_validators(models)
+        changed_at = get_changed_at(COMPOSITES.get(resource, [resource]))
+        if changed_at and last_modified:
+            last_modified = max(last_modified, datetime.fromtimestamp(changed_at, tz=timezone.utc))
+
+    if parts is None:
+        return None, None
+
+    # Different query params render different bodies, so they are part of
+    # the tag too. So is the resource version: writes that don't move
+    # updated_at (derived columns, image variants) still bump it
+    versions = get_versions(COMPOSITES.get(resource, [resource]))
+    digest = hashlib.md5(repr((resource, cache_params(request.GET), versions, parts)).encode()).hexdigest()
+    # Weak: the body may be re-encoded (e.g. compressed) on the way out
+    return f'W/"{digest}"', last_modified
+
+
+def _get_validators(resource, models, detail, request):
+    # Both condition() callbacks need the same pair, compute it once per
+    # request and remember it under the resource version until the next write
+    if not hasattr(request, "_conditional_validators"):
+        key = build_cache_key(resource, request.GET) + ":validators"
+        validators = cache.get(key)
+        if validators is None:
+            validators = _compute_validators(resource, models, detail, request)
+            cache.set(key, validators, settings.WEBSITE_CACHE_TIMEOUT)
+        request._conditional_validators = validators
+    return request._conditional_validators
+
+
+def conditional(resource, *models, detail=True):
+    """
+    ETag / Last-Modified support for a website GET handler. A matching
+    If-None-Match or If-Modified-Since gets a 304 before the handler runs,
+    so nothing is serialized.
+    """
+
+    def etag_func(request, *args, **kwargs):
+        return _get_validators(resource, models, detail, request)[0]
+
+    def last_modified_func(request, *args, **kwargs):
+        return _get_validators(resource, models, detail, request)[1]
+
+    return method_decorator(condition(etag_func=etag_func, last_modified_func=last_modified_func))
@@ -0,0 +1,56 @@
+from django.db import connection
+
+
+# Values returned per facet, most frequent first
+MAX_FACET_VALUES = 50
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def apply_facet_filters(request, queryset, fields):
+    """
+    Filter on ArrayField facets, e.g. `?tags=a,b&genre=x`. Values inside one
+    param match any (`&&`) by default, or all (`@>`) with `?match=all`.
+    Both operators are served by the GIN index on the column.
+    """
+    lookup = "contains" if request.GET.get("match") == "all" else "overlap"
+    for field in fields:
+        values = _split(request.GET.get(field, ""))
+        if values:
+            queryset = queryset.filter(**{f"{field}__{lookup}": values})
+    return queryset
+
+
+def facet_counts(queryset, fields):
+    """
+    Per-value counts for every facet of the filtered queryset, in a single
+    aggregate query: each matching row is unnested once per facet through a
+    LATERAL join and the whole thing is grouped by (facet, value). Only the
+    top MAX_FACET_VALUES of each facet leave the database.
+    """
+    model = queryset.model
+    quote = connection.ops.quote_name
+    subquery, subquery_params = queryset.order_by().values("pk").query.sql_with_params()
+
+    unnests = " UNION ALL ".join(
+        f"SELECT %s, unnest(t.{quote(model._meta.get_field(field).column)})"
+        for field in fields
+    )
+    counts = (
+        f"SELECT f.facet, f.value, COUNT(*) AS count, "
+        f"row_number() OVER (PARTITION BY f.facet ORDER BY COUNT(*) DESC, f.value) AS position "
+        f"FROM {quote(model._meta.db_table)} t "
+        f"CROSS JOIN LATERAL ({unnests}) AS f(facet, value) "
+        f"WHERE t.{quote(model._meta.pk.column)} IN ({subquery}) "
+        f"GROUP BY f.facet, f.value"
+    )
+    sql = f"SELECT facet, value, count FROM ({counts}) c WHERE position <= %s ORDER BY facet, position"
+
+    facets = {field: {} for field in fields}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*fields, *subquery_params, MAX_FACET_VALUES])
+        for facet, value, count in cursor.fetchall():
+            facets[facet][value] = count
+    return facets
@@ -0,0 +1,70 @@
+from django.db.models import F, Value
+from django.db.models.functions import JSONObject, RowNumber
+from django.db.models.expressions import Window
+
+from .models import Albums, CouraselImages, Events, Exhibitions, Shows, Singles, Stories
+
+
+LATEST = ("-created_at", "-id")
+
+# Home section -> (model, filters, ordering, columns or None for all but
+# search_vector, limited or not)
+SECTIONS = {
+    "courasel_images": (CouraselImages, {"selected": True}, ("position", "-created_at"), None, False),
+    "stories": (Stories, {}, LATEST, ("id", "title", "cover_image", "image_variants", "author", "excerpt", "reading_time", "created_at"), True),
+    "events": (Events, {}, LATEST, None, True),
+    "albums": (Albums, {}, LATEST, None, True),
+    "singles": (Singles, {}, LATEST, None, True),
+    "shows": (Shows, {}, LATEST, None, True),
+    "exhibitions": (Exhibitions, {}, LATEST, None, True),
+}
+
+
+def _fields(model, columns):
+    fields = model._meta.concrete_fields
+    if columns is None:
+        return [field for field in fields if field.name != "search_vector"]
+    return [field for field in fields if field.name in columns]
+
+
+def _ordering(ordering):
+    return [F(name[1:]).desc() if name.startswith("-") else F(name).asc() for name in ordering]
+
+
+def _section_query(section, limit):
+    model, filters, ordering, columns, limited = SECTIONS[section]
+    fields = _fields(model, columns)
+    queryset = (
+        model._base_manager.filter(**filters)
+        .order_by(*ordering)
+        .annotate(
+            home_section=Value(section),
+            home_position=Window(RowNumber(), order_by=_ordering(ordering)),
+            home_row=JSONObject(**{field.attname: field.attname for field in fields}),
+        )
+        .values_list("home_section", "home_position", "home_row")
+    )
+    return queryset[:limit] if limited else queryset
+
+
+def load_sections(limit):
+    """
+    {section: [instances]} for the home page in one round trip: a UNION ALL
+    of one LIMIT subquery per section, each on its created_at (or position)
+    index. Rows come back as jsonb_build_object() so tables with different
+    columns fit one result, and are turned back into model instances with
+    the fields' own to_python(), so serializers render them as usual.
+    """
+    queries = [_section_query(section, limit) for section in SECTIONS]
+    rows = queries[0].union(*queries[1:], all=True)
+
+    sections = {section: [] for section in SECTIONS}
+    for section, position, row in sorted(rows, key=lambda row: (row[0], row[1])):
+        model, _, _, columns, _ = SECTIONS[section]
+        fields = _fields(model, columns)
+        sections[section].append(model.from_db(
+            model._base_manager.db,
+            [field.attname for field in fields],
+            [field.to_python(row[field.attname]) for field in fields],
+        ))
+    return sections
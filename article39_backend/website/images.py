@@ -0,0 +1,212 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from io import BytesIO
+from multiprocessing import get_context
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from .cache import bump_version
+from .snapshots import SNAPSHOT_RESOURCES, publish
+
+
+# Format -> (Pillow format, file extension)
+FORMATS = {
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+}
+
+
+class LocalImageStorage(FileSystemStorage):
+    """
+    Variants on local disk under MEDIA_ROOT/image_variants/, the default
+    `image_variants` storage (see STORAGES). Point IMAGE_VARIANTS_STORAGE at
+    any Django storage backend to keep them elsewhere.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("location", os.path.join(settings.MEDIA_ROOT, "image_variants"))
+        kwargs.setdefault("base_url", settings.IMAGE_VARIANTS_BASE_URL)
+        super().__init__(**kwargs)
+
+
+# Worker side: plain Pillow, no Django
+
+def _init_worker(niceness):
+    from PIL import Image  # noqa: F401, imported once per worker
+
+    # Resizing is background work, request handling comes first
+    os.nice(niceness)
+
+
+def _encode(image, pillow_format, quality):
+    if pillow_format == "JPEG" and image.mode != "RGB":
+        from PIL import Image
+
+        # No alpha in JPEG, flatten onto white
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        image = image.convert("RGBA")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    output = BytesIO()
+    options = {"progressive": True, "optimize": True} if pillow_format == "JPEG" else {"method": 4}
+    image.save(output, pillow_format, quality=quality, **options)
+    return output.getvalue()
+
+
+def _build_variants(url, widths, formats, quality):
+    """Download `url` and return (width, height, [(format, width, bytes), ...])."""
+    import requests
+    from PIL import Image, ImageOps
+
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    image = ImageOps.exif_transpose(Image.open(BytesIO(response.content)))
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+
+    # Never upscale, an image narrower than every width gets one variant
+    # at its own size
+    targets = [width for width in widths if width < image.width] or [image.width]
+    variants = []
+    for width in targets:
+        height = max(round(image.height * width / image.width), 1)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for name in formats:
+            variants.append((name, width, _encode(resized, FORMATS[name][0], quality)))
+    return image.width, image.height, variants
+
+
+# Web process side
+
+_pool = None
+_dispatcher = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(reset=False):
+    global _pool, _dispatcher
+    with _pool_lock:
+        if reset and _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None:
+            # spawn: workers must not inherit the parent's database
+            # connections and threads
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.IMAGE_VARIANT_WORKERS,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(settings.IMAGE_VARIANT_NICENESS,),
+            )
+        if _dispatcher is None:
+            # Threads that wait for the pool and write the results back,
+            # one per worker is enough to keep the pool busy
+            _dispatcher = ThreadPoolExecutor(max_workers=settings.IMAGE_VARIANT_WORKERS)
+        return _pool
+
+
+def _resource(model):
+    return next(
+        resource
+        for resource, (_, model_name, _, _) in SNAPSHOT_RESOURCES.items()
+        if model_name == model.__name__
+    )
+
+
+def _store(url, width, height, variants):
+    storage = storages["image_variants"]
+    # Names derive from the source URL, a rebuild reuses the stored files
+    prefix = hashlib.sha256(url.encode()).hexdigest()[:24]
+    record = {"source": url, "width": width, "height": height}
+    for name, variant_width, data in variants:
+        path = f"{prefix}/{variant_width}.{FORMATS[name][1]}"
+        if not storage.exists(path):
+            storage.save(path, ContentFile(data))
+        record.setdefault(name, {})[str(variant_width)] = storage.url(path)
+    return record
+
+
+def build_variants(model, pk, url):
+    """
+    Render and store the variants of one image and save them on the row,
+    unless its image changed in the meantime. Returns the record or None.
+    """
+    job = (_build_variants, url, settings.IMAGE_VARIANT_WIDTHS, settings.IMAGE_VARIANT_FORMATS, settings.IMAGE_VARIANT_QUALITY)
+    try:
+        try:
+            width, height, variants = _get_pool().submit(*job).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. a decompression bomb), start a fresh pool once
+            width, height, variants = _get_pool(reset=True).submit(*job).result()
+    except Exception as e:
+        print(f"Image variants failed for {url}: {e}")
+        return None
+
+    close_old_connections()
+    record = _store(url, width, height, variants)
+    # srcset is in the payload, move updated_at so Last-Modified moves too
+    updated = model._base_manager.filter(pk=pk, **{model.image_field: url}).update(
+        image_variants=record, updated_at=timezone.now()
+    )
+    if updated:
+        # srcset is part of the cached payloads
+        resource = _resource(model)
+        bump_version(resource)
+        publish(resource, [pk])
+    return record if updated else None
+
+
+def _run(model, pk, url):
+    try:
+        return build_variants(model, pk, url)
+    finally:
+        # Dispatcher threads outlive requests, don't leave connections open
+        connection.close()
+
+
+def submit_variants(model, pk, url):
+    _get_pool()
+    return _dispatcher.submit(_run, model, pk, url)
+
+
+def reset_variants(instance):
+    """
+    Call before saving: drop variants of a previous image. Returns True when
+    the row has a new image to render variants for (see queue_variants).
+    """
+    deferred = instance.get_deferred_fields()
+    if instance.image_field in deferred or "image_variants" in deferred:
+        return False
+    url = getattr(instance, instance.image_field)
+    if (instance.image_variants or {}).get("source") == url:
+        return False
+    instance.image_variants = {}
+    return bool(url)
+
+
+def queue_variants(instance):
+    """Call after saving: render the variants in the background once the row is committed."""
+    if settings.IMAGE_VARIANTS_ENABLED:
+        url = getattr(instance, instance.image_field)
+        transaction.on_commit(partial(submit_variants, type(instance), instance.pk, url))
+
+
+def srcset(record):
+    """{"webp": "<url> 320w, <url> 768w", "jpeg": ..., "width": ..., "height": ...} or None."""
+    if not record or "width" not in record:
+        return None
+    result = {"width": record["width"], "height": record["height"]}
+    for name in FORMATS:
+        if name in record:
+            result[name] = ", ".join(
+                f"{url} {width}w" for width, url in sorted(record[name].items(), key=lambda item: int(item[0]))
+            )
+    return result
@@ -0,0 +1,202 @@
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, TimeoutError
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from .availability import sync_date_ranges
+from .bookings import BookingError, book_tickets, reserve_seats
+from .models import ShowBookingInformation, TicketBookings
+from .rollups import add_show_bookings, add_ticket_sales, show_booking_deltas, ticket_sale_deltas
+
+
+class BatchWriter:
+    """
+    Group commit for one kind of row. Request threads hand over an item and
+    block until the batch holding it is committed, so a 201 still means the
+    row is in the database. A batch is written when it reaches `batch_size`
+    items or `max_wait` seconds after its oldest item arrived, whichever
+    comes first; that bounds the latency added to each request.
+
+    Batching only happens between concurrent requests of one process, i.e.
+    with threaded gunicorn workers (`--threads`). When more than
+    `max_pending` items are waiting, or an item is still waiting for the
+    writer after `timeout` seconds, submit() returns None and the caller
+    writes the row itself instead of queueing behind the backlog. Once the
+    writer has taken an item, submit() waits for its batch to commit:
+    writing it again would book it twice.
+    """
+
+    def __init__(self, write_batch, batch_size, max_wait, max_pending, timeout):
+        self.write_batch = write_batch
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._pending = []
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, item):
+        future = Future()
+        with self._condition:
+            if len(self._pending) >= self.max_pending:
+                return None
+            self._pending.append((time.monotonic(), item, future))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            pass
+        with self._condition:
+            # Only succeeds while the item hasn't been taken by the writer
+            if future.cancel():
+                self._pending = [entry for entry in self._pending if entry[2] is not future]
+                return None
+        return future.result()
+
+    def _next_batch(self):
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+            deadline = self._pending[0][0] + self.max_wait
+            while len(self._pending) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = self._pending[: self.batch_size]
+            self._pending = self._pending[self.batch_size :]
+            # From here on submit() can't take these items back
+            for _, _, future in batch:
+                future.set_running_or_notify_cancel()
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            # The writer thread keeps its own connection, drop it if it
+            # went stale or broke since the last batch
+            close_old_connections()
+            try:
+                results = self.write_batch([item for _, item, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+def _write_ticket_bookings(serializers):
+    """
+    Reserve seats per event with one UPDATE for the whole batch, then insert
+    every accepted booking with one bulk_create. When an event can't take
+    the whole batch, its bookings are reserved one by one in arrival order
+    so the ones that still fit go through. Events are locked in pk order,
+    like update_booking() does, so concurrent writers can't deadlock.
+    """
+    results = [None] * len(serializers)
+    by_event = defaultdict(list)
+    for index, serializer in enumerate(serializers):
+        by_event[serializer.validated_data["event"].pk].append(index)
+
+    try:
+        with transaction.atomic():
+            for event_id, indexes in sorted(by_event.items()):
+                seats = sum(serializers[index].validated_data["number_of_tickets"] for index in indexes)
+                try:
+                    with transaction.atomic():
+                        reserve_seats(event_id, seats)
+                    continue
+                except BookingError:
+                    pass
+                for index in indexes:
+                    try:
+                        with transaction.atomic():
+                            reserve_seats(event_id, serializers[index].validated_data["number_of_tickets"])
+                    except BookingError as e:
+                        results[index] = e
+
+            accepted = [index for index, result in enumerate(results) if result is None]
+            bookings = TicketBookings.objects.bulk_create(
+                [TicketBookings(**serializers[index].validated_data) for index in accepted]
+            )
+            for index, booking in zip(accepted, bookings):
+                results[index] = booking
+            add_ticket_sales(ticket_sale_deltas(bookings))
+        return results
+    except Exception:
+        # One bad row must not fail the rest of the batch
+        return [_write_one(book_tickets, serializer) for serializer in serializers]
+
+
+def _write_show_bookings(serializers):
+    try:
+        with transaction.atomic():
+            bookings = ShowBookingInformation.objects.bulk_create(
+                [ShowBookingInformation(**serializer.validated_data) for serializer in serializers]
+            )
+            sync_date_ranges(bookings)
+            add_show_bookings(show_booking_deltas(bookings))
+            return bookings
+    except Exception:
+        return [_write_one(lambda item: item.save(), serializer) for serializer in serializers]
+
+
+def _write_one(save, serializer):
+    try:
+        return save(serializer)
+    except Exception as e:
+        return e
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(name):
+    write_batch = {
+        "ticket_bookings": _write_ticket_bookings,
+        "show_bookings": _write_show_bookings,
+    }[name]
+    with _writers_lock:
+        if name not in _writers:
+            _writers[name] = BatchWriter(
+                write_batch,
+                batch_size=settings.BOOKING_INGESTION_BATCH_SIZE,
+                max_wait=settings.BOOKING_INGESTION_MAX_WAIT_MS / 1000,
+                max_pending=settings.BOOKING_INGESTION_MAX_PENDING,
+                timeout=settings.BOOKING_INGESTION_TIMEOUT_MS / 1000,
+            )
+        return _writers[name]
+
+
+def _batched():
+    return settings.BOOKING_INGESTION_MODE == "batched"
+
+
+def save_ticket_booking(serializer, batched=None):
+    """Save a validated TicketBookingsSerializer, raising BookingError when sold out."""
+    batched = _batched() if batched is None else batched
+    booking = get_writer("ticket_bookings").submit(serializer) if batched else None
+    if booking is None:
+        booking = book_tickets(serializer)
+    serializer.instance = booking
+    return booking
+
+
+def save_show_booking(serializer, batched=None):
+    """Save a validated ShowBookingInformationSerializer."""
+    batched = _batched() if batched is None else batched
+    booking = get_writer("show_bookings").submit(serializer) if batched else None
+    if booking is None:
+        booking = serializer.save()
+    serializer.instance = booking
+    return booking
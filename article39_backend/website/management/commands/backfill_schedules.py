@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from website.cache import bump_version
+from website.models import Events, Exhibitions, Shows
+from website.schedule import apply_schedule
+from website.snapshots import rebuild
+
+# Resource name -> model with `schedule_fields`
+SCHEDULED = {
+    "events": Events,
+    "exhibitions": Exhibitions,
+    "shows": Shows,
+}
+
+
+class Command(BaseCommand):
+    help = "Parse starts_at/ends_at from the free-text date and time columns of every row."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resource",
+            choices=list(SCHEDULED),
+            action="append",
+            help="Only backfill the given resource (repeatable).",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        resources = options["resource"] or list(SCHEDULED)
+        for resource in resources:
+            model = SCHEDULED[resource]
+            columns = ["id", "starts_at", "ends_at", *[field for field in model.schedule_fields if field]]
+            rows, unparsed, changed = [], [], []
+            now = timezone.now()
+            for row in model.objects.only(*columns).iterator(chunk_size=options["batch_size"]):
+                before = (row.starts_at, row.ends_at)
+                apply_schedule(row)
+                rows.append(row)
+                if row.starts_at is None:
+                    unparsed.append(row)
+                if (row.starts_at, row.ends_at) != before:
+                    # Payloads change, so must Last-Modified and the ETag
+                    row.updated_at = now
+                    changed.append(row)
+            model.objects.bulk_update(changed, ["starts_at", "ends_at", "updated_at"], batch_size=options["batch_size"])
+
+            # The new columns are part of the payload
+            bump_version(resource)
+            if settings.WEBSITE_SNAPSHOTS_ENABLED:
+                rebuild(resource)
+
+            self.stdout.write(
+                f"{resource}: {len(rows) - len(unparsed)} parsed, {len(unparsed)} unparsed, {len(changed)} updated"
+            )
+            for row in unparsed:
+                values = ", ".join(repr(getattr(row, field)) for field in model.schedule_fields if field)
+                self.stdout.write(f"  {row.pk}: {values}")
+
+        if settings.WEBSITE_SNAPSHOTS_ENABLED:
+            rebuild("home")
@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from website.cache import bump_version
+from website.models import Stories
+from website.reading import SUMMARY_FIELDS, apply_summary
+from website.snapshots import rebuild
+
+
+class Command(BaseCommand):
+    help = "Compute excerpt, word_count and reading_time of every story from its body."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        rows = []
+        now = timezone.now()
+        stories = Stories.objects.with_body().only("id", "content", *SUMMARY_FIELDS)
+        for row in stories.iterator(chunk_size=options["batch_size"]):
+            before = [getattr(row, field) for field in SUMMARY_FIELDS]
+            apply_summary(row)
+            # The body isn't written back, don't hold on to it
+            del row.content
+            if [getattr(row, field) for field in SUMMARY_FIELDS] != before:
+                # Payloads change, so must Last-Modified and the ETag
+                row.updated_at = now
+                rows.append(row)
+        Stories.objects.bulk_update(rows, [*SUMMARY_FIELDS, "updated_at"], batch_size=options["batch_size"])
+
+        # The new columns are part of the payload
+        bump_version("stories")
+        if settings.WEBSITE_SNAPSHOTS_ENABLED:
+            rebuild("stories")
+            rebuild("home")
+
+        self.stdout.write(f"stories: {len(rows)} summarized")
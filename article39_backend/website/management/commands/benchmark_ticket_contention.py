@@ -0,0 +1,125 @@
+import queue
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Sum
+
+from website.bookings import BookingError
+from website.ingestion import save_ticket_booking
+from website.models import Events
+from website.serializers import TicketBookingsSerializer
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] if values else 0
+
+
+class Command(BaseCommand):
+    help = (
+        "Book tickets for one event from many concurrent buyers and report "
+        "throughput, latency and whether the event was oversold."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--buyers", type=int, default=500, help="Booking attempts.")
+        parser.add_argument("--capacity", type=int, default=300, help="Seats on the event.")
+        parser.add_argument("--tickets", type=int, default=1, help="Tickets per booking.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=50,
+            help="Concurrent buyers, one database connection each.",
+        )
+        parser.add_argument(
+            "--batched",
+            action="store_true",
+            help="Go through the group-commit writer of website/ingestion.py.",
+        )
+        parser.add_argument("--keep", action="store_true", help="Keep the benchmark event and its bookings.")
+
+    def _worker(self, event_id, tickets, batched, pending, start, results, lock):
+        try:
+            start.wait()
+            while True:
+                try:
+                    buyer = pending.get_nowait()
+                except queue.Empty:
+                    return
+                serializer = TicketBookingsSerializer(
+                    data={
+                        "event": event_id,
+                        "buyer_name": f"Buyer {buyer}",
+                        "buyer_email": f"buyer{buyer}@example.com",
+                        "buyer_phone": "+8801700000000",
+                        "number_of_tickets": tickets,
+                    }
+                )
+                serializer.is_valid(raise_exception=True)
+                began = time.perf_counter()
+                try:
+                    save_ticket_booking(serializer, batched=batched)
+                    outcome = "booked"
+                except BookingError:
+                    outcome = "rejected"
+                elapsed = time.perf_counter() - began
+                with lock:
+                    results[outcome] += 1
+                    results["latencies"].append(elapsed)
+        finally:
+            connection.close()
+
+    def handle(self, *args, **options):
+        event = Events.objects.create(
+            title="Ticket contention benchmark",
+            description="Created by benchmark_ticket_contention",
+            ticket_price=0,
+            date="-",
+            location="-",
+            capacity=options["capacity"],
+        )
+
+        pending = queue.Queue()
+        for buyer in range(options["buyers"]):
+            pending.put(buyer)
+        results = {"booked": 0, "rejected": 0, "latencies": []}
+        lock = threading.Lock()
+        start = threading.Barrier(options["workers"] + 1)
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(event.pk, options["tickets"], options["batched"], pending, start, results, lock),
+            )
+            for _ in range(options["workers"])
+        ]
+        for thread in threads:
+            thread.start()
+
+        start.wait()
+        began = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - began
+
+        event.refresh_from_db()
+        sold = event.ticketbookings_set.aggregate(total=Sum("number_of_tickets"))["total"] or 0
+        latencies = results["latencies"]
+        self.stdout.write(
+            f"{options['buyers']} buyers, {options['workers']} concurrent, "
+            f"{options['capacity']} seats, {options['tickets']} ticket(s) each"
+            f"{', batched' if options['batched'] else ''}\n"
+            f"  {elapsed:.2f}s, {len(latencies) / elapsed:.0f} attempts/s\n"
+            f"  booked {results['booked']}, rejected {results['rejected']}\n"
+            f"  latency p50 {_percentile(latencies, 0.5) * 1000:.1f} ms, "
+            f"p95 {_percentile(latencies, 0.95) * 1000:.1f} ms, "
+            f"max {max(latencies, default=0) * 1000:.1f} ms\n"
+            f"  sold {sold}, remaining {event.remaining_seats}"
+        )
+
+        consistent = sold <= options["capacity"] and event.remaining_seats == options["capacity"] - sold
+        if not options["keep"]:
+            event.delete()
+        if not consistent:
+            raise CommandError("Inventory is inconsistent: the event was oversold")
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from website.images import submit_variants
+from website.models import Albums, CouraselImages, Events, Exhibitions, Shows, Singles, Stories
+
+# Resource name -> model with `image_field`
+IMAGED = {
+    "courasel_images": CouraselImages,
+    "stories": Stories,
+    "events": Events,
+    "exhibitions": Exhibitions,
+    "albums": Albums,
+    "singles": Singles,
+    "shows": Shows,
+}
+
+
+class Command(BaseCommand):
+    help = "Render the responsive image variants of rows that don't have them for their current image."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resource",
+            choices=list(IMAGED),
+            action="append",
+            help="Only build the given resource (repeatable).",
+        )
+        parser.add_argument("--force", action="store_true", help="Also rebuild rows that have variants, e.g. after changing IMAGE_VARIANT_WIDTHS.")
+
+    def handle(self, *args, **options):
+        resources = options["resource"] or list(IMAGED)
+        for resource in resources:
+            model = IMAGED[resource]
+            rows = model._base_manager.exclude(**{f"{model.image_field}__isnull": True}).exclude(**{model.image_field: ""})
+            jobs = [
+                submit_variants(model, pk, url)
+                for pk, url, variants in rows.values_list("pk", model.image_field, "image_variants")
+                if options["force"] or (variants or {}).get("source") != url
+            ]
+            built = sum(job.result() is not None for job in jobs)
+            self.stdout.write(f"{resource}: {built} built, {len(jobs) - built} failed")
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from website.snapshots import SNAPSHOT_RESOURCES, check, rebuild
+
+
+class Command(BaseCommand):
+    help = "Detect drift between the stored JSON snapshots and the current rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resource",
+            choices=list(SNAPSHOT_RESOURCES),
+            action="append",
+            help="Only check the given resource (repeatable).",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the snapshots of every resource that drifted.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = []
+        for resource in options["resource"] or SNAPSHOT_RESOURCES:
+            missing, stale, orphaned = check(resource)
+            if not (missing or stale or orphaned):
+                self.stdout.write(f"{resource}: ok")
+                continue
+
+            drifted.append(resource)
+            self.stdout.write(
+                f"{resource}: {len(missing)} missing, {len(stale)} stale, {len(orphaned)} orphaned"
+            )
+            for label, keys in (("missing", missing), ("stale", stale), ("orphaned", orphaned)):
+                for key in keys:
+                    self.stdout.write(f"  {label}: {key}")
+
+        if drifted and options["fix"]:
+            for resource in drifted:
+                rebuild(resource)
+                self.stdout.write(f"{resource}: rebuilt")
+        elif drifted:
+            raise CommandError(f"Snapshots drifted for: {', '.join(drifted)}")
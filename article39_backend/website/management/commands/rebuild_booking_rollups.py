@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from website.rollups import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the show booking and ticket sale rollups from the raw bookings. "
+        "Writes keep them current; run this after bulk imports or manual SQL, "
+        "or periodically to correct any drift."
+    )
+
+    def handle(self, *args, **options):
+        show_rows, ticket_rows = rebuild()
+        self.stdout.write(f"{show_rows} month/genre rows, {ticket_rows} event rows")
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from website.search import SEARCHABLE, build_search_vector, get_model
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored search_vector column of every searchable website model."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--type",
+            choices=list(SEARCHABLE),
+            action="append",
+            help="Only rebuild the given search type (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        for search_type in options["type"] or SEARCHABLE:
+            model = get_model(search_type)
+            updated = model.objects.update(search_vector=build_search_vector(model))
+            self.stdout.write(f"{search_type}: {updated} rows indexed")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from website.availability import sync_date_ranges
+from website.models import ShowBookingInformation
+
+
+class Command(BaseCommand):
+    help = "Rebuild the indexed date ranges of every show booking from its dates JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        bookings = ShowBookingInformation.objects.only("id", "dates").order_by("id")
+        batch, count = [], 0
+        for booking in bookings.iterator(chunk_size=options["batch_size"]):
+            batch.append(booking)
+            if len(batch) == options["batch_size"]:
+                sync_date_ranges(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            sync_date_ranges(batch)
+            count += len(batch)
+        self.stdout.write(f"{count} show bookings synced")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from website.snapshots import SNAPSHOT_RESOURCES, rebuild
+
+
+class Command(BaseCommand):
+    help = "Re-render every pre-rendered JSON snapshot of the public website content."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resource",
+            choices=list(SNAPSHOT_RESOURCES),
+            action="append",
+            help="Only rebuild the given resource (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        for resource in options["resource"] or SNAPSHOT_RESOURCES:
+            count = rebuild(resource)
+            self.stdout.write(f"{resource}: {count} snapshots published")
@@ -1,41 +1,116 @@
-from django.db import models
+from django.db import models, transaction
 from uuid import uuid4
-from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.fields import ArrayField, DateRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from datetime import datetime
+from website.search import update_search_vectors
+from website.availability import sync_date_ranges
+from website.schedule import apply_schedule
+from website.reading import apply_summary
+from website.images import queue_variants, reset_variants
+from website.rollups import add_show_bookings, show_booking_deltas
 
 # Image Courasel
 class CouraselImages(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     image = models.TextField(max_length=1000, blank=False, null=False)
+    # Resized copies of `image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     selected = models.BooleanField(default=True)
+    # Display order, lowest first (set in one go through the batch endpoint)
+    position = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    # Column behind image_variants, see website/images.py
+    image_field = "image"
+
     def __str__(self):
         return self.image
+
+    def save(self, *args, **kwargs):
+        new_image = reset_variants(self)
+        super().save(*args, **kwargs)
+        if new_image:
+            queue_variants(self)
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['position', '-created_at']
         verbose_name = 'Courasel Images'
         verbose_name_plural = 'Courasel Images'
 
 
+class StoriesQuerySet(models.QuerySet):
+    def with_body(self):
+        return self.defer(None).defer("search_vector")
+
+
+class StoriesManager(models.Manager.from_queryset(StoriesQuerySet)):
+    def get_queryset(self):
+        # Bodies run up to 100 KB and only the detail view needs them, list
+        # cards use `excerpt`. Ask for the body with Stories.objects.with_body().
+        return super().get_queryset().defer("content", "search_vector")
+
+
 #Stories / Articles
 class Stories(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(max_length=1000, blank=False, null=False)
     cover_image = models.TextField(max_length=1000, blank=True, null=True)
+    # Resized copies of `cover_image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     author = models.TextField(max_length=255, blank=False, null=False)
     content = models.TextField(max_length=100000, blank=False, null=False)
     tags = ArrayField(models.CharField(max_length=255), blank=False, null=False)
+    # Derived from content on save, see website/reading.py
+    excerpt = models.TextField(blank=True, default="", editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StoriesManager()
+
+    # Full-text search, see website/search.py
+    search_document = [
+        ("title", "A"),
+        ("author", "B"),
+        ("tags", "B"),
+        ("content", "C"),
+    ]
+    search_body = "content"
+
+    # ArrayField facets filterable on the list view, see website/facets.py
+    facet_fields = ["tags"]
+
+    # Text column behind excerpt/word_count/reading_time
+    summary_field = "content"
+
+    # Column behind image_variants, see website/images.py
+    image_field = "cover_image"
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        apply_summary(self)
+        new_image = reset_variants(self)
+        super().save(*args, **kwargs)
+        update_search_vectors(Stories, [self.pk])
+        if new_image:
+            queue_variants(self)
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Stories'
         verbose_name_plural = 'Stories'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='stories_cursor_idx'),
+            GinIndex(fields=['search_vector'], name='stories_search_idx'),
+            GinIndex(fields=['tags'], name='stories_tags_idx'),
+        ]
 
 
 #Events
@@ -43,19 +118,67 @@ class Events(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(max_length=1000, blank=False, null=False)
     cover_image = models.TextField(max_length=1000, blank=True, null=True)
+    # Resized copies of `cover_image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField(max_length=100000, blank=False, null=False)
     ticket_price = models.FloatField(blank=False, null=False)
     date = models.TextField(max_length=1000, blank=False, null=False)
     location = models.TextField(max_length=1000, blank=False, null=False)
+    # Ticket inventory, None means unlimited. remaining_seats only moves
+    # through the atomic updates in website/bookings.py
+    capacity = models.PositiveIntegerField(blank=True, null=True)
+    remaining_seats = models.PositiveIntegerField(blank=True, null=True, editable=False)
+    # Parsed from the free-text date/time columns on save, see website/schedule.py
+    starts_at = models.DateTimeField(blank=True, null=True, editable=False)
+    ends_at = models.DateTimeField(blank=True, null=True, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search, see website/search.py
+    search_document = [
+        ("title", "A"),
+        ("location", "B"),
+        ("description", "C"),
+    ]
+    search_body = "description"
+
+    # (date, start time, end time) text columns behind starts_at/ends_at
+    schedule_fields = ("date", None, None)
+
+    # Column behind image_variants, see website/images.py
+    image_field = "cover_image"
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        apply_schedule(self)
+        new_image = reset_variants(self)
+        if self._state.adding:
+            self.remaining_seats = self.capacity
+        elif kwargs.get("update_fields") is None:
+            # A full save from an instance loaded before some bookings must
+            # not write stale inventory back, see bookings.set_capacity
+            kwargs["update_fields"] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in ("capacity", "remaining_seats")
+            ]
+        super().save(*args, **kwargs)
+        update_search_vectors(Events, [self.pk])
+        if new_image:
+            queue_variants(self)
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Events'
         verbose_name_plural = 'Events'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='events_cursor_idx'),
+            models.Index(fields=['starts_at'], name='events_starts_at_idx'),
+            models.Index(fields=['ends_at'], name='events_ends_at_idx'),
+            GinIndex(fields=['search_vector'], name='events_search_idx'),
+        ]
 
 # Ticket Bookings
 class TicketBookings(models.Model):
@@ -74,6 +197,10 @@ class TicketBookings(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Ticket Bookings'
         verbose_name_plural = 'Ticket Bookings'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='ticketbookings_cursor_idx'),
+        ]
 
 
 # Exhibitions
@@ -81,6 +208,8 @@ class Exhibitions(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(max_length=1000, blank=False, null=False)
     cover_image = models.TextField(max_length=1000, blank=True, null=True)
+    # Resized copies of `cover_image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField(max_length=100000, blank=False, null=False)
     date = models.TextField(max_length=1000, blank=False, null=False)
     from_time = models.TextField(max_length=1000, blank=False, null=False)
@@ -88,15 +217,54 @@ class Exhibitions(models.Model):
     location = models.TextField(max_length=1000, blank=False, null=False)
     tags = ArrayField(models.CharField(max_length=255), blank=False, null=False)
     author = models.TextField(max_length=255, blank=False, null=False)
+    # Parsed from the free-text date/time columns on save, see website/schedule.py
+    starts_at = models.DateTimeField(blank=True, null=True, editable=False)
+    ends_at = models.DateTimeField(blank=True, null=True, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search, see website/search.py
+    search_document = [
+        ("title", "A"),
+        ("author", "B"),
+        ("tags", "B"),
+        ("location", "B"),
+        ("description", "C"),
+    ]
+    search_body = "description"
+
+    # ArrayField facets filterable on the list view, see website/facets.py
+    facet_fields = ["tags"]
+
+    # (date, start time, end time) text columns behind starts_at/ends_at
+    schedule_fields = ("date", "from_time", "to_time")
+
+    # Column behind image_variants, see website/images.py
+    image_field = "cover_image"
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        apply_schedule(self)
+        new_image = reset_variants(self)
+        super().save(*args, **kwargs)
+        update_search_vectors(Exhibitions, [self.pk])
+        if new_image:
+            queue_variants(self)
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Exhibitions'
         verbose_name_plural = 'Exhibitions'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='exhibitions_cursor_idx'),
+            GinIndex(fields=['search_vector'], name='exhibitions_search_idx'),
+            GinIndex(fields=['tags'], name='exhibitions_tags_idx'),
+            models.Index(fields=['starts_at'], name='exhibitions_starts_at_idx'),
+            models.Index(fields=['ends_at'], name='exhibitions_ends_at_idx'),
+        ]
 
 
 # Albums
@@ -104,6 +272,8 @@ class Albums(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(max_length=1000, blank=False, null=False)
     cover_image = models.TextField(max_length=1000, blank=True, null=True)
+    # Resized copies of `cover_image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField(max_length=100000, blank=False, null=False)
     genre = ArrayField(models.CharField(max_length=255), blank=False, null=False)
     category = ArrayField(models.CharField(max_length=255), blank=False, null=False)
@@ -111,15 +281,49 @@ class Albums(models.Model):
     number_of_songs = models.IntegerField(blank=False, null=False)
     author = models.TextField(max_length=255, blank=False, null=False)
     tags = ArrayField(models.CharField(max_length=255), blank=False, null=False)
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Full-text search, see website/search.py
+    search_document = [
+        ("title", "A"),
+        ("artist", "A"),
+        ("author", "B"),
+        ("tags", "B"),
+        ("genre", "B"),
+        ("description", "C"),
+    ]
+    search_body = "description"
+
+    # ArrayField facets filterable on the list view, see website/facets.py
+    facet_fields = ["genre", "category", "artist", "tags"]
+
+    # Column behind image_variants, see website/images.py
+    image_field = "cover_image"
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        new_image = reset_variants(self)
+        super().save(*args, **kwargs)
+        update_search_vectors(Albums, [self.pk])
+        if new_image:
+            queue_variants(self)
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Albums'
         verbose_name_plural = 'Albums'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='albums_cursor_idx'),
+            GinIndex(fields=['search_vector'], name='albums_search_idx'),
+            GinIndex(fields=['genre'], name='albums_genre_idx'),
+            GinIndex(fields=['category'], name='albums_category_idx'),
+            GinIndex(fields=['artist'], name='albums_artist_idx'),
+            GinIndex(fields=['tags'], name='albums_tags_idx'),
+        ]
 
 
 #Singles
@@ -127,6 +331,8 @@ class Singles(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(max_length=1000, blank=False, null=False)
     cover_image = models.TextField(max_length=1000, blank=True, null=True)
+    # Resized copies of `cover_image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.TextField(max_length=100000, blank=False, null=False)
     genre = ArrayField(models.CharField(max_length=255), blank=False, null=False)
     category = ArrayField(models.CharField(max_length=255), blank=False, null=False)
@@ -137,31 +343,74 @@ class Singles(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # ArrayField facets filterable on the list view, see website/facets.py
+    facet_fields = ["genre", "category", "tags"]
+
+    # Column behind image_variants, see website/images.py
+    image_field = "cover_image"
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        new_image = reset_variants(self)
+        super().save(*args, **kwargs)
+        if new_image:
+            queue_variants(self)
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Singles'
         verbose_name_plural = 'Singles'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='singles_cursor_idx'),
+            GinIndex(fields=['genre'], name='singles_genre_idx'),
+            GinIndex(fields=['category'], name='singles_category_idx'),
+            GinIndex(fields=['tags'], name='singles_tags_idx'),
+        ]
 
 # Shows
 class Shows(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(max_length=1000, blank=False, null=False)
     cover_image = models.TextField(max_length=1000, blank=True, null=True)
+    # Resized copies of `cover_image`, filled in the background, see website/images.py
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     video_url = models.TextField(max_length=1000, blank=True, null=True)
     location = models.TextField(max_length=1000, blank=False, null=False)
     time = models.TextField(max_length=255, blank=False, null=False)
     date = models.TextField(max_length=255, blank=False, null=False)
+    # Parsed from the free-text date/time columns on save, see website/schedule.py
+    starts_at = models.DateTimeField(blank=True, null=True, editable=False)
+    ends_at = models.DateTimeField(blank=True, null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # (date, start time, end time) text columns behind starts_at/ends_at
+    schedule_fields = ("date", "time", None)
+
+    # Column behind image_variants, see website/images.py
+    image_field = "cover_image"
+
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        apply_schedule(self)
+        new_image = reset_variants(self)
+        super().save(*args, **kwargs)
+        if new_image:
+            queue_variants(self)
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Shows'
         verbose_name_plural = 'Shows'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='shows_cursor_idx'),
+            models.Index(fields=['starts_at'], name='shows_starts_at_idx'),
+            models.Index(fields=['ends_at'], name='shows_ends_at_idx'),
+        ]
 
 
 def validate_show_bookings_date_range(value):
@@ -209,7 +458,98 @@ class ShowBookingInformation(models.Model):
 
     def __str__(self):
         return self.full_name
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            if self._state.adding:
+                previous = []
+            else:
+                previous = list(ShowBookingInformation.objects.filter(pk=self.pk).only("genre", "created_at"))
+            super().save(*args, **kwargs)
+            sync_date_ranges([self])
+            # Only a new booking or a genre change moves the rollup
+            deltas = show_booking_deltas([self])
+            deltas.update(show_booking_deltas(previous, sign=-1))
+            add_show_bookings(deltas)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            add_show_bookings(show_booking_deltas([self], sign=-1))
+            return result
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Show Booking Information'
         verbose_name_plural = 'Show Booking Information'
+        indexes = [
+            # keyset pagination on (created_at, id), see website/pagination.py
+            models.Index(fields=['-created_at', '-id'], name='showbookings_cursor_idx'),
+        ]
+
+
+# One row per {start_date, end_date} item of ShowBookingInformation.dates,
+# see website/availability.py
+class ShowBookingDateRange(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    booking = models.ForeignKey(ShowBookingInformation, on_delete=models.CASCADE, related_name='date_ranges')
+    period = DateRangeField()
+
+    def __str__(self):
+        return f"{self.booking_id} {self.period}"
+    class Meta:
+        verbose_name = 'Show Booking Date Ranges'
+        verbose_name_plural = 'Show Booking Date Ranges'
+        indexes = [
+            GistIndex(fields=['period'], name='showbookings_period_idx'),
+        ]
+
+
+# Pre-rendered JSON bodies of public GET responses, see website/snapshots.py
+class ContentSnapshot(models.Model):
+    key = models.CharField(max_length=255, primary_key=True)
+    resource = models.CharField(max_length=50, db_index=True)
+    body = models.BinaryField()
+    checksum = models.CharField(max_length=64)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.key
+    class Meta:
+        ordering = ['key']
+        verbose_name = 'Content Snapshots'
+        verbose_name_plural = 'Content Snapshots'
+
+
+# Incrementally maintained booking counts for the analytics endpoint, see
+# website/rollups.py
+class ShowBookingMonthlyRollup(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    month = models.DateField()
+    genre = models.CharField(max_length=255)
+    bookings = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.genre}"
+    class Meta:
+        ordering = ['month', 'genre']
+        verbose_name = 'Show Booking Monthly Rollup'
+        verbose_name_plural = 'Show Booking Monthly Rollup'
+        constraints = [
+            models.UniqueConstraint(fields=['month', 'genre'], name='showbookings_rollup_month_genre'),
+        ]
+
+
+class EventTicketRollup(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    event = models.OneToOneField(Events, on_delete=models.CASCADE, related_name='ticket_rollup')
+    bookings = models.IntegerField(default=0)
+    tickets_sold = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.event_id} {self.tickets_sold}"
+    class Meta:
+        verbose_name = 'Event Ticket Rollup'
+        verbose_name_plural = 'Event Ticket Rollup'
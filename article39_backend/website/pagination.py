@@ -0,0 +1,118 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from fieldsets import sparse_queryset
+
+
+DEFAULT_PER_PAGE = 10
+MAX_PER_PAGE = 100
+
+
+def _positive_int(value, default):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def get_page_params(request):
+    perPage = min(_positive_int(request.GET.get("perPage"), DEFAULT_PER_PAGE), MAX_PER_PAGE)
+    page = _positive_int(request.GET.get("page"), 1)
+    return perPage, page
+
+
+def _value(row, field):
+    # Rows are model instances, or dicts when the view uses .values()
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+def encode_cursor(row, direction):
+    payload = {
+        "c": _value(row, "created_at").isoformat(),
+        "i": str(_value(row, "id")),
+        "d": direction,
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = datetime.fromisoformat(payload["c"])
+        row_id = uuid.UUID(str(payload["i"]))
+        direction = payload["d"]
+        if direction not in ("next", "prev"):
+            raise ValueError
+        return created_at, row_id, direction
+    except (ValueError, KeyError, TypeError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+
+def paginate_by_offset(request, queryset, key, serializer_class):
+    perPage, page = get_page_params(request)
+    offset = (page - 1) * perPage
+    rows = queryset.order_by("-created_at", "-id")[offset:offset + perPage]
+    total = queryset.count()
+    total_pages = total // perPage + (1 if total % perPage else 0)
+    return {
+        key: serializer_class(rows, many=True, context={"request": request}).data,
+        "total": total,
+        "perPage": perPage,
+        "page": page,
+        "totalPage": total_pages,
+        "isLastPage": page == total_pages,
+    }
+
+
+def paginate_by_cursor(request, queryset, key, serializer_class):
+    """
+    Keyset pagination on (created_at, id). The `created_at` bound is a plain
+    range condition on the cursor index, so page 500 costs the same as page 1,
+    and no COUNT(*) is run.
+    """
+    perPage, _ = get_page_params(request)
+    cursor = request.GET.get("cursor")
+
+    if cursor:
+        created_at, row_id, direction = decode_cursor(cursor)
+    else:
+        created_at, row_id, direction = None, None, "next"
+
+    if direction == "next":
+        if created_at is not None:
+            queryset = queryset.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) | Q(id__lt=row_id)
+            )
+        rows = list(queryset.order_by("-created_at", "-id")[: perPage + 1])
+        has_more = len(rows) > perPage
+        rows = rows[:perPage]
+        has_next, has_prev = has_more, created_at is not None
+    else:
+        queryset = queryset.filter(created_at__gte=created_at).filter(
+            Q(created_at__gt=created_at) | Q(id__gt=row_id)
+        )
+        rows = list(queryset.order_by("created_at", "id")[: perPage + 1])
+        has_more = len(rows) > perPage
+        rows = rows[:perPage][::-1]
+        has_next, has_prev = True, has_more
+
+    return {
+        key: serializer_class(rows, many=True, context={"request": request}).data,
+        "perPage": perPage,
+        "nextCursor": encode_cursor(rows[-1], "next") if rows and has_next else None,
+        "prevCursor": encode_cursor(rows[0], "prev") if rows and has_prev else None,
+    }
+
+
+def paginate(request, queryset, key, serializer_class):
+    # `?cursor=` (even empty) opts into keyset mode, otherwise page/perPage
+    queryset = sparse_queryset(request, queryset, serializer_class)
+    if "cursor" in request.GET:
+        return paginate_by_cursor(request, queryset, key, serializer_class)
+    return paginate_by_offset(request, queryset, key, serializer_class)
@@ -0,0 +1,43 @@
+import html
+import re
+
+from django.utils.html import strip_tags
+
+
+# Length of Stories.excerpt in characters, and the reading speed behind
+# Stories.reading_time
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+
+# Columns filled by apply_summary(), bulk writers have to save them too
+SUMMARY_FIELDS = ["excerpt", "word_count", "reading_time"]
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def plain_text(content):
+    # Bodies come from the admin's rich text editor as HTML
+    return WHITESPACE.sub(" ", html.unescape(strip_tags(content or ""))).strip()
+
+
+def summarize(content):
+    """(excerpt, word_count, reading_time in minutes) of a story body."""
+    text = plain_text(content)
+    word_count = len(text.split())
+    excerpt = text
+    if len(text) > EXCERPT_LENGTH:
+        # Cut on a word boundary
+        excerpt = text[: EXCERPT_LENGTH + 1].rsplit(" ", 1)[0].rstrip(" ,.;:") + "…"
+    reading_time = -(-word_count // WORDS_PER_MINUTE)
+    return excerpt, word_count, reading_time
+
+
+def apply_summary(instance):
+    """Fill excerpt/word_count/reading_time from the model's `summary_field`."""
+    if instance.summary_field in instance.get_deferred_fields():
+        # Body not loaded, so it isn't being written either
+        return False
+    instance.excerpt, instance.word_count, instance.reading_time = summarize(
+        getattr(instance, instance.summary_field)
+    )
+    return True
@@ -0,0 +1,111 @@
+from collections import Counter
+from uuid import uuid4
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+
+# Dashboard counters kept next to the raw bookings: every booking write
+# adds its delta here in the same transaction, so reading them costs one
+# row per (month, genre) or per event however many bookings there are.
+# `manage.py rebuild_booking_rollups` recomputes them from the raw rows.
+
+
+def _model(name):
+    return apps.get_model("website", name)
+
+
+def booking_month(created_at):
+    # Months are local, like the dates admins see
+    return timezone.localtime(created_at).date().replace(day=1)
+
+
+def _upsert(model, conflict_fields, rows, counters):
+    """INSERT ... ON CONFLICT DO UPDATE adding `counters` to the existing row."""
+    if not rows:
+        return
+    table = connection.ops.quote_name(model._meta.db_table)
+    key_columns = [model._meta.get_field(field).column for field in conflict_fields]
+    columns = ["id", *key_columns, *counters, "updated_at"]
+    placeholders = ", ".join(["(" + ", ".join(["%s"] * len(columns)) + ")"] * len(rows))
+    updates = ", ".join(f"{column} = {table}.{column} + EXCLUDED.{column}" for column in counters)
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES {placeholders} "
+        f"ON CONFLICT ({', '.join(key_columns)}) DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at"
+    )
+    now = timezone.now()
+    params = [value for row in rows for value in (uuid4(), *row, now)]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def add_show_bookings(deltas):
+    """deltas: {(month, genre): change in bookings}."""
+    # Sorted, so concurrent writers lock the rollup rows in the same order
+    rows = sorted((month, genre, delta) for (month, genre), delta in deltas.items() if delta)
+    _upsert(_model("ShowBookingMonthlyRollup"), ["month", "genre"], rows, ["bookings"])
+
+
+def add_ticket_sales(deltas):
+    """deltas: {event id: (change in bookings, change in tickets)}."""
+    rows = sorted(
+        (event_id, bookings, tickets)
+        for event_id, (bookings, tickets) in deltas.items()
+        if bookings or tickets
+    )
+    _upsert(_model("EventTicketRollup"), ["event"], rows, ["bookings", "tickets_sold"])
+
+
+def show_booking_deltas(bookings, sign=1):
+    deltas = Counter()
+    for booking in bookings:
+        deltas[(booking_month(booking.created_at), booking.genre)] += sign
+    return deltas
+
+
+def ticket_sale_deltas(bookings, sign=1):
+    deltas = {}
+    for booking in bookings:
+        count, tickets = deltas.get(booking.event_id, (0, 0))
+        deltas[booking.event_id] = (count + sign, tickets + sign * booking.number_of_tickets)
+    return deltas
+
+
+def rebuild():
+    """Recompute both rollups from the raw bookings. Returns (show rows, event rows)."""
+    show_model = _model("ShowBookingMonthlyRollup")
+    ticket_model = _model("EventTicketRollup")
+    shows = (
+        _model("ShowBookingInformation")
+        .objects.annotate(month=TruncMonth("created_at", output_field=DateField()))
+        .values("month", "genre")
+        .annotate(bookings=Count("id"))
+        .order_by()
+    )
+    tickets = (
+        _model("TicketBookings")
+        .objects.values("event")
+        .annotate(bookings=Count("id"), tickets_sold=Sum("number_of_tickets"))
+        .order_by()
+    )
+    with transaction.atomic():
+        # Writers block on the table lock until the new counts are in, so
+        # no delta lands between the delete and the recount
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {connection.ops.quote_name(show_model._meta.db_table)}, "
+                f"{connection.ops.quote_name(ticket_model._meta.db_table)} IN EXCLUSIVE MODE"
+            )
+        show_model.objects.all().delete()
+        ticket_model.objects.all().delete()
+        show_rows = show_model.objects.bulk_create([show_model(**row) for row in shows])
+        ticket_rows = ticket_model.objects.bulk_create(
+            [
+                ticket_model(event_id=row["event"], bookings=row["bookings"], tickets_sold=row["tickets_sold"])
+                for row in tickets
+            ]
+        )
+    return len(show_rows), len(ticket_rows)
@@ -0,0 +1,171 @@
+import re
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+
+# The admin types dates and times as free text. These are the spellings
+# seen so far; anything else leaves starts_at/ends_at empty (see
+# `manage.py backfill_schedules`, which reports the rows it couldn't parse).
+DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%Y/%m/%d",
+    "%d.%m.%Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%B %d %Y",
+    "%b %d %Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%d %B, %Y",
+    "%d %b, %Y",
+    "%A, %B %d, %Y",
+    "%a, %b %d, %Y",
+    "%A, %d %B %Y",
+    "%a, %d %b %Y",
+]
+
+TIME_FORMATS = [
+    "%I:%M %p",
+    "%I:%M%p",
+    "%I %p",
+    "%I%p",
+    "%H:%M",
+    "%H:%M:%S",
+]
+
+RANGE_SEPARATOR = re.compile(r"\s+(?:-|–|—|to)\s+", re.IGNORECASE)
+ORDINAL_SUFFIX = re.compile(r"(\d+)(?:st|nd|rd|th)\b", re.IGNORECASE)
+LEADING_DAY = re.compile(r"^\s*\d{1,2}\b")
+
+
+def _parse_one_date(text):
+    text = ORDINAL_SUFFIX.sub(r"\1", " ".join(text.split()))
+    try:
+        parsed = datetime.fromisoformat(text)
+        # Compared as local wall-clock time like every other spelling
+        return timezone.localtime(parsed).replace(tzinfo=None) if timezone.is_aware(parsed) else parsed
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_date_range(text):
+    """
+    Parse "20 March 2025", "2025-03-20", "20 - 25 March 2025",
+    "March 20, 2025 to March 22, 2025", ... into a (first, last) pair of
+    datetimes, or None. The time part is midnight unless the text had one.
+    """
+    if not text:
+        return None
+    parts = RANGE_SEPARATOR.split(text.strip())
+    last = _parse_one_date(parts[-1])
+    if last is None:
+        return None
+    first = _parse_one_date(parts[0]) if len(parts) > 1 else last
+    if first is None and parts[0].strip().isdigit():
+        # "20 - 25 March 2025": the month and year are only on the last day
+        first = _parse_one_date(LEADING_DAY.sub(parts[0].strip(), ORDINAL_SUFFIX.sub(r"\1", parts[-1]), count=1))
+    if first is None:
+        return None
+    return first, last
+
+
+def parse_time(text):
+    if not text:
+        return None
+    text = text.upper().replace("A.M.", "AM").replace("P.M.", "PM").replace(".", ":").strip()
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_time_range(text):
+    """Parse "6 PM" or "10:00AM - 5:00PM" into (start, end) times, either may be None."""
+    if not text:
+        return None, None
+    parts = RANGE_SEPARATOR.split(text.strip())
+    start = parse_time(parts[0])
+    end = parse_time(parts[-1]) if len(parts) > 1 else None
+    return start, end
+
+
+def parse_schedule(date_text, start_time_text=None, end_time_text=None):
+    """
+    (starts_at, ends_at) aware datetimes for the free-text columns, or
+    (None, None). Without an end time the entry lasts until the end of its
+    last day, so it stays "upcoming" on the day itself.
+    """
+    dates = parse_date_range(date_text)
+    if dates is None:
+        return None, None
+    first, last = dates
+
+    start_time, end_time = parse_time_range(start_time_text)
+    if end_time_text:
+        end_time = parse_time(end_time_text) or end_time
+    if start_time is None and first.time() != time.min:
+        start_time = first.time()
+
+    starts_at = datetime.combine(first.date(), start_time or time.min)
+    ends_at = datetime.combine(last.date(), end_time or time.max)
+    if ends_at < starts_at:
+        # e.g. 8 PM - 2 AM on a single date
+        ends_at += timedelta(days=1)
+
+    tz = timezone.get_current_timezone()
+    return timezone.make_aware(starts_at, tz), timezone.make_aware(ends_at, tz)
+
+
+def apply_schedule(instance):
+    """Fill starts_at/ends_at from the model's `schedule_fields` text columns."""
+    date_field, start_time_field, end_time_field = instance.schedule_fields
+    instance.starts_at, instance.ends_at = parse_schedule(
+        getattr(instance, date_field),
+        getattr(instance, start_time_field) if start_time_field else None,
+        getattr(instance, end_time_field) if end_time_field else None,
+    )
+
+
+def upcoming_cutoff():
+    # Whole hours, so a cached ?upcoming=true page stays exact for its hour
+    # (the hour is part of the cache key, see website/cache.py)
+    return timezone.now().replace(minute=0, second=0, microsecond=0)
+
+
+def _parse_bound(value, param, end_of_day):
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError({param: "Use YYYY-MM-DD or an ISO 8601 datetime."})
+    if len(value) == 10 and end_of_day:
+        parsed = datetime.combine(parsed.date(), time.max)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def filter_schedule(request, queryset):
+    """
+    `?upcoming=true` keeps entries that haven't ended, `?from=&to=` entries
+    overlapping the window (dates include the whole day). Both are range
+    conditions on the indexed starts_at/ends_at columns.
+    """
+    if request.GET.get("upcoming") == "true":
+        queryset = queryset.filter(ends_at__gte=upcoming_cutoff())
+    if request.GET.get("from"):
+        queryset = queryset.filter(ends_at__gte=_parse_bound(request.GET["from"], "from", end_of_day=False))
+    if request.GET.get("to"):
+        queryset = queryset.filter(starts_at__lte=_parse_bound(request.GET["to"], "to", end_of_day=True))
+    return queryset
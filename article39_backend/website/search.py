@@ -0,0 +1,129 @@
+import base64
+import json
+import math
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db.models import CharField, F, FloatField, Func, Q, TextField, Value
+from django.db.models.functions import Cast
+from rest_framework.exceptions import ValidationError
+
+
+# Search type -> model name. Each model declares `search_document`, a list
+# of (field, weight) pairs, and `search_body`, the field snippets come from.
+SEARCHABLE = {
+    "stories": "Stories",
+    "events": "Events",
+    "exhibitions": "Exhibitions",
+    "albums": "Albums",
+}
+
+
+def get_model(search_type):
+    return apps.get_model("website", SEARCHABLE[search_type])
+
+
+def build_search_vector(model):
+    vector = None
+    for field, weight in model.search_document:
+        expression = F(field)
+        if isinstance(model._meta.get_field(field), ArrayField):
+            expression = Func(
+                F(field), Value(" "), function="array_to_string", output_field=TextField()
+            )
+        part = SearchVector(expression, weight=weight, config=settings.WEBSITE_SEARCH_CONFIG)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def update_search_vectors(model, pks):
+    # Computed by Postgres from the stored row, .update() leaves updated_at alone
+    model.objects.filter(pk__in=pks).update(search_vector=build_search_vector(model))
+
+
+def encode_cursor(row):
+    payload = {"r": row["rank"], "i": str(row["id"])}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        rank = float(payload["r"])
+        if not math.isfinite(rank):
+            raise ValueError
+        return rank, uuid.UUID(str(payload["i"]))
+    except (ValueError, KeyError, TypeError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+
+def search(text, search_types, limit, cursor=None):
+    """
+    Ranked full-text search over the stored `search_vector` columns.
+
+    Matching and ranking run as one UNION over the GIN indexed columns and
+    only return (type, id, rank). Snippets are then generated for the rows
+    on the page only, since ts_headline re-parses the whole body.
+    """
+    query = SearchQuery(text, search_type="websearch", config=settings.WEBSITE_SEARCH_CONFIG)
+
+    parts = []
+    for search_type in search_types:
+        queryset = (
+            get_model(search_type)
+            .objects.filter(search_vector=query)
+            .annotate(
+                # ts_rank is float4; as float8 the value survives the round
+                # trip through the cursor exactly, so keyset comparisons hold
+                rank=Cast(SearchRank(F("search_vector"), query), FloatField()),
+                type=Value(search_type, output_field=CharField()),
+            )
+        )
+        if cursor:
+            rank, row_id = decode_cursor(cursor)
+            queryset = queryset.filter(Q(rank__lt=rank) | Q(rank=rank, id__lt=row_id))
+        parts.append(queryset.values("id", "type", "rank").order_by())
+
+    combined = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+    rows = list(combined.order_by("-rank", "-id")[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    details = {}
+    for search_type in {row["type"] for row in rows}:
+        model = get_model(search_type)
+        ids = [row["id"] for row in rows if row["type"] == search_type]
+        for item in (
+            model.objects.filter(id__in=ids)
+            .annotate(
+                snippet=SearchHeadline(
+                    model.search_body,
+                    query,
+                    config=settings.WEBSITE_SEARCH_CONFIG,
+                    start_sel="<mark>",
+                    stop_sel="</mark>",
+                    max_words=35,
+                    min_words=15,
+                )
+            )
+            .values("id", "title", "cover_image", "created_at", "snippet")
+        ):
+            details[item["id"]] = item
+
+    results = [
+        {"type": row["type"], "rank": row["rank"], **details[row["id"]]}
+        for row in rows
+        if row["id"] in details
+    ]
+    return {
+        "results": results,
+        "nextCursor": encode_cursor(rows[-1]) if has_more else None,
+    }
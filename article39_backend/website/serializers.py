@@ -1,52 +1,89 @@
+from django.conf import settings
 from rest_framework import serializers
+from fieldsets import SparseFieldsetMixin
 from website.models import Albums, Singles, Shows, Events, Exhibitions, CouraselImages, Stories, TicketBookings, ShowBookingInformation
+from website.images import srcset
+
+
+class SrcsetField(serializers.ReadOnlyField):
+    # image_variants as ready to use srcset strings, see website/images.py
+    def to_representation(self, value):
+        return srcset(value)
+
+
+class AlbumsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
 
-class AlbumsSerializer(serializers.ModelSerializer):
     class Meta:
         model = Albums
-        fields = '__all__'
+        exclude = ['search_vector', 'image_variants']
         
-class SinglesSerializer(serializers.ModelSerializer):
+class SinglesSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
+
     class Meta:
         model = Singles
-        fields = '__all__'
+        exclude = ['image_variants']
         
-class ShowsSerializer(serializers.ModelSerializer):
+class ShowsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
+
     class Meta:
         model = Shows
-        fields = '__all__'
+        exclude = ['image_variants']
         
-class EventsSerializer(serializers.ModelSerializer):
+class EventsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
+
     class Meta:
         model = Events
-        fields = '__all__'
+        # Seats change with every booking, they are served uncached by
+        # EventAvailabilityView instead of churning the events cache
+        exclude = ['search_vector', 'remaining_seats', 'image_variants']
         
-class ExhibitionsSerializer(serializers.ModelSerializer):
+class ExhibitionsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
+
     class Meta:
         model = Exhibitions
-        fields = '__all__'
+        exclude = ['search_vector', 'image_variants']
+
+class CouraselImagesSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
 
-class CouraselImagesSerializer(serializers.ModelSerializer):
     class Meta:
         model = CouraselImages
-        fields = '__all__'
+        exclude = ['image_variants']
         
-class StoriesSerializer(serializers.ModelSerializer):
+class StoriesSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
+
     class Meta:
         model = Stories
-        fields = '__all__'
+        exclude = ['search_vector', 'image_variants']
+
+class StoriesSerializerShort(SparseFieldsetMixin, serializers.ModelSerializer):
+    srcset = SrcsetField(source="image_variants")
 
-class StoriesSerializerShort(serializers.ModelSerializer):
     class Meta:
         model = Stories
-        fields = ['id', 'title', 'cover_image', 'author', 'created_at']
+        fields = ['id', 'title', 'cover_image', 'srcset', 'author', 'excerpt', 'reading_time', 'created_at']
         
-class TicketBookingsSerializer(serializers.ModelSerializer):
+class TicketBookingsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = TicketBookings
         fields = '__all__'
 
-class ShowBookingInformationSerializer(serializers.ModelSerializer):
+    def validate_number_of_tickets(self, value):
+        if value < 1:
+            raise serializers.ValidationError("At least one ticket must be booked.")
+        if value > settings.TICKETS_PER_BOOKING_MAX:
+            raise serializers.ValidationError(
+                f"At most {settings.TICKETS_PER_BOOKING_MAX} tickets can be booked at once."
+            )
+        return value
+
+class ShowBookingInformationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = ShowBookingInformation
         fields = '__all__'
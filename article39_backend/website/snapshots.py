@@ -0,0 +1,186 @@
+import hashlib
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.apps import apps
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.urls import resolve, reverse
+
+
+# Resource -> (url name, model name, paginated list, has ?id= detail).
+# Snapshots cover the default list pages, every detail document and the
+# home payload; any other combination of params falls through to the cache.
+SNAPSHOT_RESOURCES = {
+    "courasel_images": ("courasel-images", "CouraselImages", False, False),
+    "stories": ("stories", "Stories", True, True),
+    "events": ("events", "Events", True, True),
+    "albums": ("albums", "Albums", True, True),
+    "singles": ("singles", "Singles", True, True),
+    "shows": ("shows", "Shows", True, True),
+    "exhibitions": ("exhibitions", "Exhibitions", True, True),
+    "home": ("home", None, False, False),
+}
+
+# Matches DEFAULT_PER_PAGE in website/pagination.py
+PER_PAGE = 10
+
+
+def _snapshot_model():
+    return apps.get_model("website", "ContentSnapshot")
+
+
+def _model(resource):
+    return apps.get_model("website", SNAPSHOT_RESOURCES[resource][1])
+
+
+def snapshot_key(resource, params):
+    return f"{resource}?{urlencode(sorted(params.items()))}"
+
+
+def _request_key(resource, query_params):
+    # Only canonical requests are snapshotted: no params, ?page=n within
+    # the published pages, or ?id= on resources with a detail view
+    _, _, paginated, has_detail = SNAPSHOT_RESOURCES[resource]
+    params = {key: query_params.get(key) for key in query_params.keys()}
+    if not params:
+        return snapshot_key(resource, params)
+    if paginated and params.keys() == {"page"}:
+        if params["page"].isdigit() and 1 <= int(params["page"]) <= settings.WEBSITE_SNAPSHOT_LIST_PAGES:
+            return snapshot_key(resource, params)
+    if has_detail and params.keys() == {"id"}:
+        return snapshot_key(resource, params)
+    return None
+
+
+def render(resource, params):
+    """Run the resource's GET view in-process and return (status, body bytes)."""
+    request = HttpRequest()
+    request.method = "GET"
+    request.GET = QueryDict(urlencode(params))
+    request.publishing_snapshot = True
+    view = resolve(reverse(SNAPSHOT_RESOURCES[resource][0])).func
+    response = view(request)
+    if hasattr(response, "render"):
+        response.render()
+    return response.status_code, response.content
+
+
+def _store(resource, key, body):
+    _snapshot_model().objects.update_or_create(
+        key=key,
+        defaults={
+            "resource": resource,
+            "body": body,
+            "checksum": hashlib.sha256(body).hexdigest(),
+        },
+    )
+
+
+def _publish_key(resource, params):
+    key = snapshot_key(resource, params)
+    status_code, body = render(resource, params)
+    if status_code == 200:
+        _store(resource, key, body)
+    else:
+        # Deleted row (404) or anything else we must not serve
+        _snapshot_model().objects.filter(key=key).delete()
+    return status_code, body
+
+
+def _list_params(resource):
+    _, _, paginated, _ = SNAPSHOT_RESOURCES[resource]
+    if not paginated:
+        return [{}]
+    total = _model(resource).objects.count()
+    pages = min(max(-(-total // PER_PAGE), 1), settings.WEBSITE_SNAPSHOT_LIST_PAGES)
+    return [{}] + [{"page": str(page)} for page in range(1, pages + 1)]
+
+
+def expected_params(resource):
+    params = _list_params(resource)
+    if SNAPSHOT_RESOURCES[resource][3]:
+        ids = _model(resource).objects.values_list("id", flat=True)
+        params += [{"id": str(object_id)} for object_id in ids]
+    return params
+
+
+def publish(resource, object_ids=()):
+    """
+    Re-render what a write to `resource` can change: its list pages, the
+    detail documents of the written rows and the home payload.
+    """
+    if not settings.WEBSITE_SNAPSHOTS_ENABLED:
+        return
+
+    # Pages past the new last page (e.g. after a delete) are dropped too
+    list_params = _list_params(resource)
+    keep = {snapshot_key(resource, params) for params in list_params}
+    _snapshot_model().objects.filter(resource=resource, key__startswith=f"{resource}?page=").exclude(key__in=keep).delete()
+    for params in list_params:
+        _publish_key(resource, params)
+
+    if SNAPSHOT_RESOURCES[resource][3]:
+        for object_id in object_ids:
+            _publish_key(resource, {"id": str(object_id)})
+
+    if resource != "home":
+        _publish_key("home", {})
+
+
+def rebuild(resource):
+    _snapshot_model().objects.filter(resource=resource).delete()
+    count = 0
+    for params in expected_params(resource):
+        status_code, _ = _publish_key(resource, params)
+        count += status_code == 200
+    return count
+
+
+def check(resource):
+    """
+    Compare stored snapshots with a fresh render of the current rows.
+    Returns (missing, stale, orphaned) lists of keys.
+    """
+    stored = dict(
+        _snapshot_model().objects.filter(resource=resource).values_list("key", "checksum")
+    )
+    missing, stale = [], []
+    expected = set()
+    for params in expected_params(resource):
+        key = snapshot_key(resource, params)
+        expected.add(key)
+        _, body = render(resource, params)
+        if key not in stored:
+            missing.append(key)
+        elif stored[key] != hashlib.sha256(body).hexdigest():
+            stale.append(key)
+    orphaned = sorted(set(stored) - expected)
+    return missing, stale, orphaned
+
+
+def serve_snapshot(resource):
+    """Answer a canonical GET straight from the stored bytes, no ORM model or serializer work."""
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if (
+                settings.WEBSITE_SNAPSHOTS_ENABLED
+                and not getattr(request, "publishing_snapshot", False)
+                and request.accepted_renderer.format == "json"
+            ):
+                key = _request_key(resource, request.GET)
+                if key:
+                    snapshot = _snapshot_model().objects.filter(key=key).values_list("body", "checksum").first()
+                    if snapshot is not None:
+                        body, checksum = snapshot
+                        response = HttpResponse(bytes(body), content_type="application/json")
+                        # Content addressed, compressed once per published body
+                        response.compression_key = f"snapshot:{checksum}"
+                        return response
+            return view_method(self, request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,14 +1,24 @@
 from django.urls import path
-from website.views import CouraselImagesView, StoriesView, EventsView, TicketBookingsView, ExhibitionsView, AlbumView, SinglesView, ShowsView, ShowBookingInformationView
+from website.views import CouraselImagesView, CouraselImagesBatchView, StoriesView, StoriesBatchView, EventsView, TicketBookingsView, EventAvailabilityView, ExhibitionsView, AlbumView, AlbumsBatchView, SinglesView, SinglesBatchView, ShowsView, ShowBookingInformationView, ShowBookingAvailabilityView, BookingAnalyticsView, HomeView, SearchView, CacheStatsView
 
 urlpatterns = [    
     path('courasel-images/', CouraselImagesView.as_view(), name='courasel-images'),
+    path('courasel-images/batch/', CouraselImagesBatchView.as_view(), name='courasel-images-batch'),
     path('stories/', StoriesView.as_view(), name='stories'),
+    path('stories/batch/', StoriesBatchView.as_view(), name='stories-batch'),
     path('events/', EventsView.as_view(), name='events'),
+    path('events/availability/', EventAvailabilityView.as_view(), name='event-availability'),
     path('tickets/', TicketBookingsView.as_view(), name='tickets'),
     path('exhibitions/', ExhibitionsView.as_view(), name='exhibitions'),
     path('albums/', AlbumView.as_view(), name='albums'),
+    path('albums/batch/', AlbumsBatchView.as_view(), name='albums-batch'),
     path('singles/', SinglesView.as_view(), name='singles'),
+    path('singles/batch/', SinglesBatchView.as_view(), name='singles-batch'),
     path('shows/', ShowsView.as_view(), name='shows'),
     path('bookings/', ShowBookingInformationView.as_view(), name='show-booking-information'),
+    path('bookings/availability/', ShowBookingAvailabilityView.as_view(), name='show-booking-availability'),
+    path('analytics/bookings/', BookingAnalyticsView.as_view(), name='booking-analytics'),
+    path('home/', HomeView.as_view(), name='home'),
+    path('search/', SearchView.as_view(), name='search'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
 ]
\ No newline at end of file
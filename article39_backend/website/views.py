@@ -1,10 +1,28 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from .models import Exhibitions, Events, CouraselImages, Stories, TicketBookings, ShowBookingInformation, Albums, Singles, Shows
+from .models import Exhibitions, Events, CouraselImages, Stories, TicketBookings, ShowBookingInformation, Albums, Singles, Shows, ShowBookingMonthlyRollup, EventTicketRollup, validate_show_bookings_date_range
 from .serializers import ShowsSerializer, EventsSerializer, ExhibitionsSerializer, CouraselImagesSerializer, StoriesSerializer, TicketBookingsSerializer, AlbumsSerializer, SinglesSerializer, ShowBookingInformationSerializer, StoriesSerializerShort
 
 from django.conf import settings
+from .cache import cached_get, invalidates, get_stats
+from .pagination import paginate
+from .conditional import conditional
+from .search import SEARCHABLE, search
+from .facets import apply_facet_filters, facet_counts
+from .snapshots import serve_snapshot
+from fieldsets import sparse_queryset
+from compression import get_compression_stats
+from pdf_rendering import get_pdf_stats
+from exports import EXPORT_RENDERER_CLASSES, export_response, wants_export
+from utils import send_ticket_confirmation
+from .bookings import BookingError, cancel_booking, parse_capacity, set_capacity, update_booking
+from .ingestion import save_show_booking, save_ticket_booking
+from .availability import booked_dates, overlapping_bookings, parse_date, parse_month
+from .schedule import filter_schedule
+from .home import load_sections
+from .batch import apply_batch, BATCH_RESOURCES
+from django.core.exceptions import ValidationError
 
 # Middleware for checking if the user has admin permission
 def check_admin(request):
@@ -15,14 +33,42 @@ def check_admin(request):
             return False
     return False
 
+# Create, update and delete many rows in one request, see website/batch.py
+def batch_response(request, resource):
+    if not check_admin(request):
+        return Response(
+            {"success": False, "message": "You are not authorized to perform this action"},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+    created, updated, deleted = apply_batch(resource, request.data)
+    serializer_class = BATCH_RESOURCES[resource][1]
+    response = Response(
+        {
+            "success": True,
+            "data": {
+                "created": serializer_class(created, many=True).data,
+                "updated": serializer_class(updated, many=True).data,
+                "deleted": [str(object_id) for object_id in deleted],
+            },
+        },
+        status=status.HTTP_200_OK,
+    )
+    # Detail snapshots to republish, see website/cache.py
+    response.written_ids = [instance.pk for instance in created + updated] + deleted
+    return response
+
 class CouraselImagesView(APIView):
+    @conditional("courasel_images", CouraselImages, detail=False)
+    @serve_snapshot("courasel_images")
+    @cached_get("courasel_images")
     def get(self, request, *args, **kwargs):
-        courasel_images = CouraselImages.objects.filter(selected=True).order_by("-created_at")
-        serializer = CouraselImagesSerializer(courasel_images, many=True)
+        courasel_images = sparse_queryset(request, CouraselImages.objects.filter(selected=True).order_by("position", "-created_at"), CouraselImagesSerializer)
+        serializer = CouraselImagesSerializer(courasel_images, many=True, context={"request": request})
         return Response(
             {"success": True, "data": serializer.data}, status=status.HTTP_200_OK
         )
     
+    @invalidates("courasel_images")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -40,6 +86,7 @@ class CouraselImagesView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
     
+    @invalidates("courasel_images")
     def put(self, request):
         if not check_admin(request):
             return Response(
@@ -66,6 +113,7 @@ class CouraselImagesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
+    @invalidates("courasel_images")
     def delete(self, request):
         if not check_admin(request):
             return Response(
@@ -92,13 +140,21 @@ class CouraselImagesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+class CouraselImagesBatchView(APIView):
+    @invalidates("courasel_images")
+    def post(self, request):
+        return batch_response(request, "courasel_images")
+
 class StoriesView(APIView):
+    @conditional("stories", Stories)
+    @serve_snapshot("stories")
+    @cached_get("stories")
     def get(self, request, *args, **kwargs):
         story_id = request.GET.get("id", None)
         if story_id:
             try:
-                story = Stories.objects.get(id=story_id)
-                serializer = StoriesSerializer(story)
+                story = sparse_queryset(request, Stories.objects.with_body(), StoriesSerializer).get(id=story_id)
+                serializer = StoriesSerializer(story, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Stories.DoesNotExist:
                 return Response(
@@ -107,24 +163,16 @@ class StoriesView(APIView):
                 )
         else:
             #Paginate stories
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            stories = Stories.objects.all().values("id", "title", "cover_image", "author", "created_at").order_by("-created_at")[offset:offset+perPage]
-            total_stories = Stories.objects.count()
-            total_pages = total_stories // perPage + (1 if total_stories % perPage else 0)
-            serializer = StoriesSerializerShort(stories, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "stories": serializer.data,
-                    "total": total_stories,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            stories = apply_facet_filters(request, Stories.objects.all().values("id", "title", "cover_image", "image_variants", "author", "excerpt", "reading_time", "created_at"), Stories.facet_fields)
+            data = paginate(request, stories, "stories", StoriesSerializerShort)
+            if request.GET.get("facets") == "true":
+                data["facets"] = facet_counts(stories, Stories.facet_fields)
+            return Response(
+                {"success": True, "data": data},
+                status=status.HTTP_200_OK,
             )
     
+    @invalidates("stories")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -142,6 +190,7 @@ class StoriesView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
     
+    @invalidates("stories")
     def put(self, request):
         if not check_admin(request):
             return Response(
@@ -151,7 +200,7 @@ class StoriesView(APIView):
         story_id = request.GET.get("id", None)
         if story_id:
             try:
-                story = Stories.objects.get(id=story_id)
+                story = Stories.objects.with_body().get(id=story_id)
                 story.title = request.data.get("title", story.title)
                 story.cover_image = request.data.get("cover_image", story.cover_image)
                 story.author = request.data.get("author", story.author)
@@ -171,6 +220,7 @@ class StoriesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
+    @invalidates("stories")
     def delete(self, request):
         if not check_admin(request):
             return Response(
@@ -198,13 +248,22 @@ class StoriesView(APIView):
             )
 
 
+class StoriesBatchView(APIView):
+    @invalidates("stories")
+    def post(self, request):
+        return batch_response(request, "stories")
+
+
 class EventsView(APIView):
+    @conditional("events", Events)
+    @serve_snapshot("events")
+    @cached_get("events")
     def get(self, request, *args, **kwargs):
         event_id = request.GET.get("id", None)
         if event_id:
             try:
-                event = Events.objects.get(id=event_id)
-                serializer = EventsSerializer(event)
+                event = sparse_queryset(request, Events.objects.all(), EventsSerializer).get(id=event_id)
+                serializer = EventsSerializer(event, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Events.DoesNotExist:
                 return Response(
@@ -213,24 +272,13 @@ class EventsView(APIView):
                 )
         else:
             #Paginate events
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            events = Events.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_events = Events.objects.count()
-            total_pages = total_events // perPage + (1 if total_events % perPage else 0)
-            serializer = EventsSerializer(events, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "events": serializer.data,
-                    "total": total_events,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            events = filter_schedule(request, Events.objects.all())
+            return Response(
+                {"success": True, "data": paginate(request, events, "events", EventsSerializer)},
+                status=status.HTTP_200_OK,
             )
     
+    @invalidates("events")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -248,6 +296,7 @@ class EventsView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    @invalidates("events")
     def put(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -264,6 +313,8 @@ class EventsView(APIView):
                 event.ticket_price = request.data.get("ticket_price", event.ticket_price)
                 event.date = request.data.get("date", event.date)
                 event.location = request.data.get("location", event.location)
+                if "capacity" in request.data:
+                    set_capacity(event, parse_capacity(request.data.get("capacity")))
                 event.save()
                 serializer = EventsSerializer(event)
                 return Response({"success": True, "data": serializer.data}, status=status.HTTP_200_OK)
@@ -272,12 +323,18 @@ class EventsView(APIView):
                     {"success": False, "message": "Event not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
+            except BookingError as e:
+                return Response(
+                    {"success": False, "message": str(e)},
+                    status=status.HTTP_409_CONFLICT,
+                )
         else:
             return Response(
                 {"success": False, "message": "No event ID provided"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    @invalidates("events")
     def delete(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -305,12 +362,15 @@ class EventsView(APIView):
 
 
 class TicketBookingsView(APIView):
+    # ?format=csv|ndjson streams every booking, see exports.py
+    renderer_classes = EXPORT_RENDERER_CLASSES
+
     def get(self, request, *args, **kwargs):
         ticket_booking_id = request.GET.get("id", None)
         if ticket_booking_id:
             try:
-                ticket_booking = TicketBookings.objects.get(id=ticket_booking_id)
-                serializer = TicketBookingsSerializer(ticket_booking)
+                ticket_booking = sparse_queryset(request, TicketBookings.objects.all(), TicketBookingsSerializer).get(id=ticket_booking_id)
+                serializer = TicketBookingsSerializer(ticket_booking, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except TicketBookings.DoesNotExist:
                 return Response(
@@ -319,28 +379,26 @@ class TicketBookingsView(APIView):
                 )
         else:
             #Paginate ticket bookings
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            ticket_bookings = TicketBookings.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_ticket_bookings = TicketBookings.objects.count()
-            total_pages = total_ticket_bookings // perPage + (1 if total_ticket_bookings % perPage else 0)
-            serializer = TicketBookingsSerializer(ticket_bookings, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "ticket_bookings": serializer.data,
-                    "total": total_ticket_bookings,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            ticket_bookings = TicketBookings.objects.all()
+            if wants_export(request):
+                ticket_bookings = sparse_queryset(request, ticket_bookings.order_by("-created_at"), TicketBookingsSerializer)
+                return export_response(request, ticket_bookings, TicketBookingsSerializer, "ticket_bookings")
+            return Response(
+                {"success": True, "data": paginate(request, ticket_bookings, "ticket_bookings", TicketBookingsSerializer)},
+                status=status.HTTP_200_OK,
             )
     
     def post(self, request):
         serializer = TicketBookingsSerializer(data=request.data)
         if serializer.is_valid(raise_exception=True):
-            serializer.save()
+            try:
+                save_ticket_booking(serializer)
+            except BookingError as e:
+                return Response(
+                    {"success": False, "message": str(e)},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            send_ticket_confirmation(serializer.instance)
             return Response(
                 {"success": True, "data":serializer.data}, status=status.HTTP_201_CREATED
             )
@@ -354,12 +412,9 @@ class TicketBookingsView(APIView):
         if ticket_booking_id:
             try:
                 ticket_booking = TicketBookings.objects.get(id=ticket_booking_id)
-                ticket_booking.event = request.data.get("event", ticket_booking.event)
-                ticket_booking.buyer_name = request.data.get("buyer_name", ticket_booking.buyer_name)
-                ticket_booking.buyer_email = request.data.get("buyer_email", ticket_booking.buyer_email)
-                ticket_booking.buyer_phone = request.data.get("buyer_phone", ticket_booking.buyer_phone)
-                ticket_booking.number_of_tickets = request.data.get("number_of_tickets", ticket_booking.number_of_tickets)
-                ticket_booking.save()
+                serializer = TicketBookingsSerializer(ticket_booking, data=request.data, partial=True)
+                serializer.is_valid(raise_exception=True)
+                ticket_booking = update_booking(ticket_booking_id, serializer.validated_data)
                 serializer = TicketBookingsSerializer(ticket_booking)
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except TicketBookings.DoesNotExist:
@@ -367,6 +422,11 @@ class TicketBookingsView(APIView):
                     {"success": False, "message": "Ticket booking not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
+            except BookingError as e:
+                return Response(
+                    {"success": False, "message": str(e)},
+                    status=status.HTTP_409_CONFLICT,
+                )
         else:
             return Response(
                 {"success": False, "message": "No ticket booking ID provided"},
@@ -382,7 +442,7 @@ class TicketBookingsView(APIView):
         ticket_booking_id = request.GET.get("id", None)
         if ticket_booking_id:
             try:
-                TicketBookings.objects.get(id=ticket_booking_id).delete()
+                cancel_booking(ticket_booking_id)
                 return Response(
                     {"success": True, "message": "Ticket booking deleted"},
                     status=status.HTTP_200_OK,
@@ -398,13 +458,37 @@ class TicketBookingsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+class EventAvailabilityView(APIView):
+    # Read from the row on every request, never cached or snapshotted since
+    # it changes with each booking
+    def get(self, request, *args, **kwargs):
+        event_id = request.GET.get("id", None)
+        if not event_id:
+            return Response(
+                {"success": False, "message": "No event ID provided"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        availability = Events.objects.filter(id=event_id).values("id", "capacity", "remaining_seats").first()
+        if availability is None:
+            return Response(
+                {"success": False, "message": "Event not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        availability["sold_out"] = availability["remaining_seats"] == 0
+        return Response(
+            {"success": True, "data": availability}, status=status.HTTP_200_OK
+        )
+
 class ExhibitionsView(APIView):
+    @conditional("exhibitions", Exhibitions)
+    @serve_snapshot("exhibitions")
+    @cached_get("exhibitions")
     def get(self, request, *args, **kwargs):
         exhibition_id = request.GET.get("id", None)
         if exhibition_id:
             try:
-                exhibition = Exhibitions.objects.get(id=exhibition_id)
-                serializer = ExhibitionsSerializer(exhibition)
+                exhibition = sparse_queryset(request, Exhibitions.objects.all(), ExhibitionsSerializer).get(id=exhibition_id)
+                serializer = ExhibitionsSerializer(exhibition, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Exhibitions.DoesNotExist:
                 return Response(
@@ -413,24 +497,16 @@ class ExhibitionsView(APIView):
                 )
         else:
             #Paginate exhibitions
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            exhibitions = Exhibitions.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_exhibitions = Exhibitions.objects.count()
-            total_pages = total_exhibitions // perPage + (1 if total_exhibitions % perPage else 0)
-            serializer = ExhibitionsSerializer(exhibitions, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "exhibitions": serializer.data,
-                    "total": total_exhibitions,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            exhibitions = filter_schedule(request, apply_facet_filters(request, Exhibitions.objects.all(), Exhibitions.facet_fields))
+            data = paginate(request, exhibitions, "exhibitions", ExhibitionsSerializer)
+            if request.GET.get("facets") == "true":
+                data["facets"] = facet_counts(exhibitions, Exhibitions.facet_fields)
+            return Response(
+                {"success": True, "data": data},
+                status=status.HTTP_200_OK,
             )
     
+    @invalidates("exhibitions")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -448,6 +524,7 @@ class ExhibitionsView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
     
+    @invalidates("exhibitions")
     def put(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -481,6 +558,7 @@ class ExhibitionsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
+    @invalidates("exhibitions")
     def delete(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -508,12 +586,15 @@ class ExhibitionsView(APIView):
 
 
 class AlbumView(APIView):
+    @conditional("albums", Albums)
+    @serve_snapshot("albums")
+    @cached_get("albums")
     def get(self, request, *args, **kwargs):
         album_id = request.GET.get("id", None)
         if album_id:
             try:
-                album = Albums.objects.get(id=album_id)
-                serializer = AlbumsSerializer(album)
+                album = sparse_queryset(request, Albums.objects.all(), AlbumsSerializer).get(id=album_id)
+                serializer = AlbumsSerializer(album, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Albums.DoesNotExist:
                 return Response(
@@ -522,24 +603,16 @@ class AlbumView(APIView):
                 )
         else:
             #Paginate albums
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            albums = Albums.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_albums = Albums.objects.count()
-            total_pages = total_albums // perPage + (1 if total_albums % perPage else 0)
-            serializer = AlbumsSerializer(albums, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "albums": serializer.data,
-                    "total": total_albums,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            albums = apply_facet_filters(request, Albums.objects.all(), Albums.facet_fields)
+            data = paginate(request, albums, "albums", AlbumsSerializer)
+            if request.GET.get("facets") == "true":
+                data["facets"] = facet_counts(albums, Albums.facet_fields)
+            return Response(
+                {"success": True, "data": data},
+                status=status.HTTP_200_OK,
             )
     
+    @invalidates("albums")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -557,6 +630,7 @@ class AlbumView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
     
+    @invalidates("albums")
     def put(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -590,6 +664,7 @@ class AlbumView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
+    @invalidates("albums")
     def delete(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -615,13 +690,21 @@ class AlbumView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+class AlbumsBatchView(APIView):
+    @invalidates("albums")
+    def post(self, request):
+        return batch_response(request, "albums")
+
 class SinglesView(APIView):
+    @conditional("singles", Singles)
+    @serve_snapshot("singles")
+    @cached_get("singles")
     def get(self, request, *args, **kwargs):
         single_id = request.GET.get("id", None)
         if single_id:
             try:
-                single = Singles.objects.get(id=single_id)
-                serializer = SinglesSerializer(single)
+                single = sparse_queryset(request, Singles.objects.all(), SinglesSerializer).get(id=single_id)
+                serializer = SinglesSerializer(single, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Singles.DoesNotExist:
                 return Response(
@@ -630,24 +713,16 @@ class SinglesView(APIView):
                 )
         else:
             #Paginate singles
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            singles = Singles.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_singles = Singles.objects.count()
-            total_pages = total_singles // perPage + (1 if total_singles % perPage else 0)
-            serializer = SinglesSerializer(singles, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "singles": serializer.data,
-                    "total": total_singles,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            singles = apply_facet_filters(request, Singles.objects.all(), Singles.facet_fields)
+            data = paginate(request, singles, "singles", SinglesSerializer)
+            if request.GET.get("facets") == "true":
+                data["facets"] = facet_counts(singles, Singles.facet_fields)
+            return Response(
+                {"success": True, "data": data},
+                status=status.HTTP_200_OK,
             )
     
+    @invalidates("singles")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -665,6 +740,7 @@ class SinglesView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    @invalidates("singles")
     def put(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -698,6 +774,7 @@ class SinglesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
+    @invalidates("singles")
     def delete(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -723,13 +800,21 @@ class SinglesView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+class SinglesBatchView(APIView):
+    @invalidates("singles")
+    def post(self, request):
+        return batch_response(request, "singles")
+
 class ShowsView(APIView):
+    @conditional("shows", Shows)
+    @serve_snapshot("shows")
+    @cached_get("shows")
     def get(self, request, *args, **kwargs):
         show_id = request.GET.get("id", None)
         if show_id:
             try:
-                show = Shows.objects.get(id=show_id)
-                serializer = ShowsSerializer(show)
+                show = sparse_queryset(request, Shows.objects.all(), ShowsSerializer).get(id=show_id)
+                serializer = ShowsSerializer(show, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except Shows.DoesNotExist:
                 return Response(
@@ -738,24 +823,13 @@ class ShowsView(APIView):
                 )
         else:
             #Paginate shows
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            shows = Shows.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_shows = Shows.objects.count()
-            total_pages = total_shows // perPage + (1 if total_shows % perPage else 0)
-            serializer = ShowsSerializer(shows, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "shows": serializer.data,
-                    "total": total_shows,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            shows = filter_schedule(request, Shows.objects.all())
+            return Response(
+                {"success": True, "data": paginate(request, shows, "shows", ShowsSerializer)},
+                status=status.HTTP_200_OK,
             )
     
+    @invalidates("shows")
     def post(self, request):
         if not check_admin(request):
             return Response(
@@ -773,6 +847,7 @@ class ShowsView(APIView):
             status=status.HTTP_400_BAD_REQUEST,
         )
     
+    @invalidates("shows")
     def put(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -803,6 +878,7 @@ class ShowsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
+    @invalidates("shows")
     def delete(self, request, *args, **kwargs):
         if not check_admin(request):
             return Response(
@@ -830,12 +906,15 @@ class ShowsView(APIView):
 
 
 class ShowBookingInformationView(APIView):
+    # ?format=csv|ndjson streams every booking, see exports.py
+    renderer_classes = EXPORT_RENDERER_CLASSES
+
     def get(self, request, *args, **kwargs):
         show_booking_information_id = request.GET.get("id", None)
         if show_booking_information_id:
             try:
-                show_booking_information = ShowBookingInformation.objects.get(id=show_booking_information_id)
-                serializer = ShowBookingInformationSerializer(show_booking_information)
+                show_booking_information = sparse_queryset(request, ShowBookingInformation.objects.all(), ShowBookingInformationSerializer).get(id=show_booking_information_id)
+                serializer = ShowBookingInformationSerializer(show_booking_information, context={"request": request})
                 return Response(serializer.data, status=status.HTTP_200_OK)
             except ShowBookingInformation.DoesNotExist:
                 return Response(
@@ -844,22 +923,13 @@ class ShowBookingInformationView(APIView):
                 )
         else:
             #Paginate show booking information
-            perPage = request.GET.get("perPage", 10)
-            page = request.GET.get("page", 1)
-            offset = (page - 1) * perPage
-            show_booking_informations = ShowBookingInformation.objects.all().order_by("-created_at")[offset:offset+perPage]
-            total_show_booking_informations = ShowBookingInformation.objects.count()
-            total_pages = total_show_booking_informations // perPage + (1 if total_show_booking_informations % perPage else 0)
-            serializer = ShowBookingInformationSerializer(show_booking_informations, many=True)
-            return Response(
-                {"success": True, "data": {
-                    "show_booking_informations": serializer.data,
-                    "total": total_show_booking_informations,
-                    "perPage": perPage,
-                    "page": page,
-                    "totalPage": total_pages,
-                    "isLastPage": page==total_pages
-                }}, status=status.HTTP_200_OK
+            show_booking_informations = ShowBookingInformation.objects.all()
+            if wants_export(request):
+                show_booking_informations = sparse_queryset(request, show_booking_informations.order_by("-created_at"), ShowBookingInformationSerializer)
+                return export_response(request, show_booking_informations, ShowBookingInformationSerializer, "show_bookings")
+            return Response(
+                {"success": True, "data": paginate(request, show_booking_informations, "show_booking_informations", ShowBookingInformationSerializer)},
+                status=status.HTTP_200_OK,
             )
     
     def post(self, request):
@@ -870,7 +940,7 @@ class ShowBookingInformationView(APIView):
             )
         serializer = ShowBookingInformationSerializer(data=request.data)
         if serializer.is_valid(raise_exception=True):
-            serializer.save()
+            save_show_booking(serializer)
             return Response(
                 {"success": True, "data":serializer.data}, status=status.HTTP_201_CREATED
             )
@@ -894,6 +964,7 @@ class ShowBookingInformationView(APIView):
                 show_booking_information.phone = request.data.get("phone", show_booking_information.phone)
                 show_booking_information.dates = request.data.get("dates", show_booking_information.dates)
                 show_booking_information.genre = request.data.get("genre", show_booking_information.genre)
+                validate_show_bookings_date_range(show_booking_information.dates)
                 show_booking_information.save()
                 serializer = ShowBookingInformationSerializer(show_booking_information)
                 return Response(serializer.data, status=status.HTTP_200_OK)
@@ -902,6 +973,11 @@ class ShowBookingInformationView(APIView):
                     {"success": False, "message": "Show booking information not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
+            except ValidationError as e:
+                return Response(
+                    {"success": False, "message": e.messages},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
         else:
             return Response(
                 {"success": False, "message": "No show booking information ID provided"},
@@ -933,3 +1009,160 @@ class ShowBookingInformationView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+
+
+class ShowBookingAvailabilityView(APIView):
+    # `?month=YYYY-MM` lists the booked days of the month, `?start_date=&end_date=`
+    # tells whether the range overlaps existing bookings
+    def get(self, request, *args, **kwargs):
+        if request.GET.get("month"):
+            start, end = parse_month(request.GET.get("month"))
+            return Response(
+                {"success": True, "data": {"month": request.GET.get("month"), "dates": booked_dates(start, end)}},
+                status=status.HTTP_200_OK,
+            )
+        if request.GET.get("start_date") or request.GET.get("end_date"):
+            start = parse_date(request.GET.get("start_date"), "start_date")
+            end = parse_date(request.GET.get("end_date"), "end_date")
+            if start > end:
+                return Response(
+                    {"success": False, "message": "start_date must not be after end_date"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            bookings = overlapping_bookings(start, end)
+            return Response(
+                {"success": True, "data": {"overlaps": bool(bookings), "bookings": bookings}},
+                status=status.HTTP_200_OK,
+            )
+        return Response(
+            {"success": False, "message": "Provide month, or start_date and end_date"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class BookingAnalyticsView(APIView):
+    # Show bookings per month and genre, tickets sold per event. Reads the
+    # rollup tables only (see website/rollups.py), so the cost doesn't grow
+    # with the number of bookings. `?from_month=&to_month=` (YYYY-MM) narrow
+    # the months.
+    def get(self, request, *args, **kwargs):
+        if not check_admin(request):
+            return Response(
+                {"success": False, "message": "You are not authorized to perform this action"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        show_rollups = ShowBookingMonthlyRollup.objects.filter(bookings__gt=0)
+        if request.GET.get("from_month"):
+            show_rollups = show_rollups.filter(month__gte=parse_month(request.GET.get("from_month"))[0])
+        if request.GET.get("to_month"):
+            show_rollups = show_rollups.filter(month__lte=parse_month(request.GET.get("to_month"))[0])
+
+        by_month = []
+        by_genre = {}
+        for rollup in show_rollups.order_by("month", "genre"):
+            by_month.append({"month": f"{rollup.month:%Y-%m}", "genre": rollup.genre, "bookings": rollup.bookings})
+            by_genre[rollup.genre] = by_genre.get(rollup.genre, 0) + rollup.bookings
+
+        ticket_rollups = (
+            EventTicketRollup.objects.select_related("event")
+            .only("bookings", "tickets_sold", "event__id", "event__title", "event__capacity", "event__remaining_seats")
+            .order_by("-tickets_sold")
+        )
+        tickets = [
+            {
+                "event": rollup.event_id,
+                "title": rollup.event.title,
+                "bookings": rollup.bookings,
+                "tickets_sold": rollup.tickets_sold,
+                "capacity": rollup.event.capacity,
+                "remaining_seats": rollup.event.remaining_seats,
+            }
+            for rollup in ticket_rollups
+        ]
+        return Response(
+            {"success": True, "data": {
+                "show_bookings": {"by_month": by_month, "by_genre": by_genre, "total": sum(by_genre.values())},
+                "tickets": tickets,
+            }},
+            status=status.HTTP_200_OK,
+        )
+
+
+class HomeView(APIView):
+    # Landing page: selected carousel images plus the latest items of each
+    # content type. All sections load in one UNION ALL query (see
+    # website/home.py), and the whole payload is cached as a unit (see
+    # COMPOSITES).
+    DEFAULT_LIMIT = 6
+    MAX_LIMIT = 20
+
+    @conditional("home", CouraselImages, Stories, Events, Albums, Singles, Shows, Exhibitions, detail=False)
+    @serve_snapshot("home")
+    @cached_get("home")
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(int(request.GET.get("limit", self.DEFAULT_LIMIT)), self.MAX_LIMIT)
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+        limit = max(limit, 1)
+
+        sections = load_sections(limit)
+        return Response(
+            {"success": True, "data": {
+                "courasel_images": CouraselImagesSerializer(sections["courasel_images"], many=True).data,
+                "stories": StoriesSerializerShort(sections["stories"], many=True).data,
+                "events": EventsSerializer(sections["events"], many=True).data,
+                "albums": AlbumsSerializer(sections["albums"], many=True).data,
+                "singles": SinglesSerializer(sections["singles"], many=True).data,
+                "shows": ShowsSerializer(sections["shows"], many=True).data,
+                "exhibitions": ExhibitionsSerializer(sections["exhibitions"], many=True).data,
+            }}, status=status.HTTP_200_OK
+        )
+
+
+class SearchView(APIView):
+    DEFAULT_LIMIT = 10
+    MAX_LIMIT = 50
+
+    @cached_get("search")
+    def get(self, request, *args, **kwargs):
+        query = request.GET.get("q", "").strip()
+        if not query:
+            return Response(
+                {"success": False, "message": "No search query provided"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        search_types = [t for t in request.GET.get("type", "").split(",") if t]
+        if not search_types:
+            search_types = list(SEARCHABLE)
+        unknown = [t for t in search_types if t not in SEARCHABLE]
+        if unknown:
+            return Response(
+                {"success": False, "message": f"Unknown search type: {', '.join(unknown)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            limit = min(int(request.GET.get("limit", self.DEFAULT_LIMIT)), self.MAX_LIMIT)
+        except ValueError:
+            limit = self.DEFAULT_LIMIT
+        limit = max(limit, 1)
+
+        return Response(
+            {"success": True, "data": search(query, search_types, limit, request.GET.get("cursor"))},
+            status=status.HTTP_200_OK,
+        )
+
+
+class CacheStatsView(APIView):
+    def get(self, request, *args, **kwargs):
+        if not check_admin(request):
+            return Response(
+                {"success": False, "message": "You are not authorized to perform this action"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        return Response(
+            {"success": True, "data": get_stats(), "compression": get_compression_stats(), "pdf": get_pdf_stats()},
+            status=status.HTTP_200_OK,
+        )